@@ -6,17 +6,49 @@ the difference between each pair of integers, and prints the sum of those
 differences.
 """
 
+from __future__ import annotations
+
+import os
 import sys
+import tempfile
+from array import array
+from bisect import insort
+from collections import Counter
+from heapq import merge
+from itertools import accumulate, islice, repeat
+from operator import mul, sub
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.parsing import int_table, ints
+from aoc.stream import chunks
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import('numpy')
 
+# Pairs held in memory at once by main_external, integers read back from
+# each run at a time while merging, and runs merged at once
+RUN_SIZE = 1 << 20
+READ_SIZE = 1 << 13
+FAN_IN = 64
 
-def parse(input_string: str) -> tuple[list[int], list[int]]:
+
+def parse(input_string: str | bytes) -> tuple[list[int], list[int]]:
     """Parses a string of integers into two lists of integers."""
-    list1 = []
-    list2 = []
-    for line in input_string.splitlines():
-        list1.append(int(line.split()[0]))
-        list2.append(int(line.split()[1]))
-    return list1, list2
+    values = ints(input_string)
+    return values[0::2], values[1::2]
+
+
+def parse_numpy(input_string: str | bytes) -> tuple[NDArray[np.int64],
+                                                    NDArray[np.int64]]:
+    """Parses a string of integers into two arrays, in one pass."""
+    table = int_table(input_string)
+    return table[:, 0], table[:, 1]
 
 
 def main(input_string: str) -> int:
@@ -40,7 +72,201 @@ def main(input_string: str) -> int:
     return total
 
 
+def main_numpy(input_string: str | bytes) -> int:
+    """Calculates the same sum as main with NumPy: both columns are sorted
+    and subtracted as arrays.
+
+    >>> main_numpy(b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n')
+    11
+    """
+    list1, list2 = parse_numpy(input_string)
+    return int(np.abs(np.sort(list1) - np.sort(list2)).sum())
+
+
+class LocationIndex:
+    """Both lists of location IDs, kept as counts, so pairs can be added as
+    they arrive and both answers queried at any point.
+
+    The similarity score (part 2) is kept up to date as pairs are added: an
+    ID x scores x * (its count in list1) * (its count in list2), so adding
+    one only changes its own term.
+
+    For the distance, let N1(t) and N2(t) be how many IDs in each list are
+    at most t. Pairing the sorted lists off, the sum of |a - b| is the area
+    between N1 and N2, i.e. the sum over t of |N1(t) - N2(t)|. The distinct
+    IDs are kept in order (new ones are merged in as they arrive), so a query
+    is one walk over them, however many pairs there are, rather than a sort
+    of both lists.
+
+    >>> index = LocationIndex()
+    >>> index.update([3, 4, 2], [4, 3, 5])
+    >>> index.distance(), index.similarity
+    (3, 7)
+    >>> for pair in [(1, 3), (3, 9), (3, 3)]:
+    ...     index.add(*pair)
+    >>> index.distance(), index.similarity, len(index)
+    (11, 31, 6)
+    """
+    def __init__(self):
+        self.counts1: Counter[int] = Counter()
+        self.counts2: Counter[int] = Counter()
+        self.ids: list[int] = []
+        self.similarity = 0
+        self._distance: int | None = 0
+
+    def __len__(self) -> int:
+        return self.counts1.total()
+
+    def add(self, id1: int, id2: int):
+        """Adds a pair of IDs, one to each list."""
+        if id1 not in self.counts1 and id1 not in self.counts2:
+            insort(self.ids, id1)
+        self.counts1[id1] += 1
+        self.similarity += id1 * self.counts2[id1]
+        if id2 not in self.counts1 and id2 not in self.counts2:
+            insort(self.ids, id2)
+        self.counts2[id2] += 1
+        self.similarity += id2 * self.counts1[id2]
+        self._distance = None
+
+    def update(self, list1: list[int], list2: list[int]):
+        """Adds a batch of pairs, the i-th ID of each list being a pair."""
+        if len(list1) != len(list2):
+            raise ValueError('Both lists must be the same length')
+        batch1, batch2 = Counter(list1), Counter(list2)
+        counts1, counts2 = self.counts1, self.counts2
+        for x in batch1.keys() | batch2.keys():
+            old1, old2 = counts1[x], counts2[x]
+            if not old1 and not old2:
+                self.ids.append(x)
+            self.similarity += x * ((old1 + batch1[x]) * (old2 + batch2[x])
+                                    - old1 * old2)
+        counts1.update(batch1)
+        counts2.update(batch2)
+        # The IDs already held are one sorted run, so this only sorts the new
+        # ones and merges them in
+        self.ids.sort()
+        self._distance = None
+
+    def distance(self) -> int:
+        """Returns the total distance between the two lists, sorted."""
+        if self._distance is None:
+            ids = self.ids
+            # N1(t) - N2(t) from each ID up to the next, and how far that is
+            levels = accumulate(map(sub, map(self.counts1.get, ids, repeat(0)),
+                                    map(self.counts2.get, ids, repeat(0))))
+            gaps = map(sub, islice(ids, 1, None), ids)
+            self._distance = sum(map(mul, map(abs, levels), gaps))
+        return self._distance
+
+
+def main_stream(stream: BinaryIO) -> int:
+    """Calculates the same sum as main, reading the lists a block at a time
+    into a LocationIndex. Only the count of each integer is kept, so memory
+    depends on how many distinct integers there are, not on how long the
+    lists are.
+
+    >>> import io
+    >>> data = b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n'
+    >>> main_stream(io.BytesIO(data))
+    11
+    """
+    index = LocationIndex()
+    for block in chunks(stream):
+        index.update(*parse(block))
+    return index.distance()
+
+
+def _write_run(values: Iterable[int], directory: str,
+               size: int = READ_SIZE) -> str:
+    """Writes sorted integers to a new file in directory as 8 byte integers,
+    size of them at a time, and returns its path."""
+    handle, path = tempfile.mkstemp(dir=directory, suffix='.run')
+    values = iter(values)
+    with open(handle, 'wb') as file:
+        while block := array('q', islice(values, size)):
+            block.tofile(file)
+    return path
+
+
+def _read_run(path: str, size: int = READ_SIZE) -> Iterator[int]:
+    """Yields the integers in a run file, reading size of them at a time,
+    and deletes it once they have all been read."""
+    with open(path, 'rb') as file:
+        while True:
+            values = array('q')
+            try:
+                values.fromfile(file, size)
+            except EOFError:
+                # Fewer than size were left; they were read all the same
+                yield from values
+                break
+            yield from values
+    os.remove(path)
+
+
+def _merge_runs(paths: list[str], directory: str,
+                fan_in: int = FAN_IN) -> Iterator[int]:
+    """Merges sorted runs, at most fan_in at a time. While there are more
+    than that, groups of fan_in are merged into new runs, pass after pass,
+    so only fan_in files are ever open and read into at once."""
+    while len(paths) > fan_in:
+        paths = [_write_run(merge(*map(_read_run, paths[i:i + fan_in])),
+                            directory)
+                 for i in range(0, len(paths), fan_in)]
+    return merge(*map(_read_run, paths))
+
+
+def main_external(stream: BinaryIO, run_size: int = RUN_SIZE,
+                  fan_in: int = FAN_IN) -> int:
+    """Calculates the same sum as main for inputs too big to sort in memory,
+    with an external merge sort. Pairs are read a block at a time, and each
+    run_size of them is sorted column by column and spilled to temporary
+    files of 8 byte integers, one sorted run per column. The runs are then
+    merged back at most fan_in at a time (in several passes if there are
+    more), both columns in lockstep, and paired off. Memory is bounded by
+    run_size pairs while reading and by fan_in small read buffers per
+    column while merging, and at most 2 * fan_in files are open at once.
+
+    >>> import io
+    >>> data = b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n'
+    >>> main_external(io.BytesIO(data), run_size=1, fan_in=2)
+    11
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        runs1: list[str] = []
+        runs2: list[str] = []
+        list1: list[int] = []
+        list2: list[int] = []
+        for block in chunks(stream):
+            column1, column2 = parse(block)
+            list1 += column1
+            list2 += column2
+            while len(list1) >= run_size:
+                runs1.append(_write_run(sorted(list1[:run_size]), directory))
+                runs2.append(_write_run(sorted(list2[:run_size]), directory))
+                del list1[:run_size], list2[:run_size]
+        if list1 or list2:
+            runs1.append(_write_run(sorted(list1), directory))
+            runs2.append(_write_run(sorted(list2), directory))
+        del list1, list2
+        sorted1 = _merge_runs(runs1, directory, fan_in)
+        sorted2 = _merge_runs(runs2, directory, fan_in)
+        return sum(map(abs, map(sub, sorted1, sorted2)))
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif '--external' in sys.argv[1:]:
+        run_size = RUN_SIZE
+        if '--run-size' in sys.argv[1:]:
+            run_size = int(sys.argv[sys.argv.index('--run-size') + 1])
+        print(main_external(sys.stdin.buffer, run_size))
+    elif '--numpy' in sys.argv[1:]:
+        print(main_numpy(sys.stdin.buffer.read()))
+    else:
+        print(main(sys.stdin.read()))
@@ -9,8 +9,23 @@ list1[i] * list2.count(list1[i])
 for each element in list1.
 """
 
+import os
 import sys
-from part1 import parse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO
+from part1 import LocationIndex, parse, parse_numpy
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.stream import chunks, line_ranges
+
+np = lazy_import('numpy')
+
+# Bytes of input counted per task by main_parallel, at most
+RANGE_SIZE = 1 << 24
 
 
 def generate_counts(id_list: list[int]) -> dict[int, int]:
@@ -38,7 +53,88 @@ def main(input_string: str) -> int:
     return sum(x * counts.get(x, 0) for x in list1)
 
 
+def main_numpy(input_string: str | bytes) -> int:
+    """Calculates the same sum as main with NumPy. np.unique gives each list's
+    distinct values and their counts, and a binary search of list2's values
+    for each of list1's pairs them up, so x scores x * (its count in list1) *
+    (its count in list2). Searching with distinct values rather than every
+    element of list1 keeps the search short and in cache.
+
+    >>> main_numpy(b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n')
+    31
+    """
+    list1, list2 = parse_numpy(input_string)
+    values1, counts1 = np.unique(list1, return_counts=True)
+    values2, counts2 = np.unique(list2, return_counts=True)
+    if len(values2) == 0:
+        return 0
+    index = np.searchsorted(values2, values1).clip(max=len(values2) - 1)
+    found = values2[index] == values1
+    return int((values1 * counts1 * np.where(found, counts2[index], 0)).sum())
+
+
+def main_stream(stream: BinaryIO) -> int:
+    """Calculates the same sum as main, reading the lists a block at a time
+    into a LocationIndex, which keeps the score up to date as they arrive.
+
+    >>> import io
+    >>> data = b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n'
+    >>> main_stream(io.BytesIO(data))
+    31
+    """
+    index = LocationIndex()
+    for block in chunks(stream):
+        index.update(*parse(block))
+    return index.similarity
+
+
+def count_range(path: str | os.PathLike,
+                byte_range: tuple[int, int]) -> tuple[Counter[int],
+                                                      Counter[int]]:
+    """Counts each integer in each list, in one byte range of a file."""
+    start, end = byte_range
+    with open(path, 'rb') as file:
+        file.seek(start)
+        list1, list2 = parse(file.read(end - start))
+    return Counter(list1), Counter(list2)
+
+
+def main_parallel(path: str | os.PathLike, workers: int | None = None) -> int:
+    """Calculates the same sum as main from an input file, counted in
+    parallel. The file is cut into byte ranges on line boundaries, a few per
+    worker (and more if they would be large), and each worker process counts
+    both lists within its ranges. As x scores x * (its count in list1) *
+    (its count in list2), only the merged counts are needed.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as file:
+    ...     _ = file.write(b'3   4\\n4   3\\n2   5\\n1   3\\n3   9\\n3   3\\n')
+    ...     file.flush()
+    ...     main_parallel(file.name, workers=2)
+    31
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = max(workers * 4, os.path.getsize(path) // RANGE_SIZE)
+    ranges = line_ranges(path, parts)
+    counts1: Counter[int] = Counter()
+    counts2: Counter[int] = Counter()
+    with ProcessPoolExecutor(workers) as pool:
+        for range1, range2 in pool.map(partial(count_range, path), ranges):
+            counts1.update(range1)
+            counts2.update(range2)
+    return sum(x * n * counts2[x] for x, n in counts1.items())
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--parallel' in sys.argv[1:]:
+        paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+        print(main_parallel(paths[0]))
+    elif '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif '--numpy' in sys.argv[1:]:
+        print(main_numpy(sys.stdin.buffer.read()))
+    else:
+        print(main(sys.stdin.read()))
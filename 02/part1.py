@@ -6,17 +6,106 @@ organized in rows. It then calculates counts how many rows are considered
 decrease by a maximum of 3. Lists that increase or decrease by more or stay the
 same are considered unsafe."""
 
+from __future__ import annotations
+
+import io
+import os
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator, Sequence
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.parsing import int_padded, int_rows
+from aoc.stream import chunks, line_ranges
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import('numpy')
+
+# Bytes of input checked per task by main_parallel, at most
+RANGE_SIZE = 1 << 24
+
+
+class Reports:
+    """Every report's levels in one flat array('i'), at 4 bytes a level,
+    with the offset of each report's first level in another, rather than a
+    list of lists of ints (a pointer per level, plus 56 bytes or more per
+    list). Iterating gives each report in turn as a short array.
+
+    >>> reports = parse('7 6 4 2 1\\n1 2 7\\n')
+    >>> len(reports), reports[1], list(reports[0])
+    (2, array('i', [1, 2, 7]), [7, 6, 4, 2, 1])
+    """
+    def __init__(self):
+        self.levels = array('i')
+        self.offsets = array('q', [0])
+
+    def extend(self, values: list[int], offsets: list[int]):
+        """Appends the rows of integers int_rows returns."""
+        start = len(self.levels)
+        self.levels.extend(values)
+        self.offsets.extend(start + offset for offset in offsets[1:])
 
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
 
-def parse(input_string: str) -> list[list[int]]:
-    """Parses rows of integers into a list of lists."""
-    reports = []
-    for report in [x.split() for x in input_string.split('\n') if x != '']:
-        reports.append([int(x) for x in report])
+    def __getitem__(self, i: int) -> Sequence[int]:
+        return self.levels[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[Sequence[int]]:
+        levels = self.levels
+        return (levels[i:j] for i, j in pairwise(self.offsets))
+
+
+def parse(input_string: str | bytes) -> Reports:
+    """Parses rows of integers into Reports, a block of lines at a time so
+    that only the compact arrays grow with the input."""
+    if isinstance(input_string, str):
+        input_string = input_string.encode()
+    reports = Reports()
+    for block in chunks(io.BytesIO(input_string)):
+        reports.extend(*int_rows(block))
     return reports
 
 
+def parse_numpy(input_string: str | bytes) -> tuple[NDArray[np.int64],
+                                                    NDArray[np.intp]]:
+    """Parses rows of integers into a zero-padded array and row lengths."""
+    return int_padded(input_string)
+
+
+def is_safe(report: Sequence[int]) -> bool:
+    """Determines whether a report only increases or decreases, by 3 or less
+    at each step.
+
+    >>> is_safe([7, 6, 4, 2, 1])
+    True
+    >>> is_safe([1, 2, 7, 8, 9])
+    False
+    """
+    # If unsafe, return immediately.
+    delta = report[1] - report[0]
+    if abs(delta) > 3 or delta == 0:
+        return False
+
+    # Determine whether the sequence is increasing or decreasing.
+    sign = delta / abs(delta)
+
+    for i in range(2, len(report)):
+        delta = int((report[i] - report[i - 1]) * sign)
+        if delta > 3 or delta <= 0:
+            return False
+
+    return True
+
+
 def main(input_string: str) -> int:
     """Calculates the number of safe reports in a list.
 
@@ -30,33 +119,88 @@ def main(input_string: str) -> int:
     >>> main(input_string)
     2
     """
-    reports = parse(input_string)
+    return sum(is_safe(report) for report in parse(input_string))
 
-    count = 0
 
-    for report in reports:
-        # If unsafe, break immediately.
-        delta = report[1] - report[0]
-        if abs(delta) > 3 or delta == 0:
-            continue
+def safe_rows(table: NDArray[np.int64],
+              lengths: NDArray[np.intp]) -> NDArray[np.bool_]:
+    """Determines is_safe for every report at once, given them as the rows
+    of a zero-padded array and their lengths. The steps along each row are
+    checked for being all increasing, or all decreasing, by 1 to 3; steps
+    into the padding are let through either way.
+
+    >>> table = np.array([[7, 6, 4, 2, 1], [1, 2, 7, 8, 9], [1, 3, 6, 0, 0]])
+    >>> safe_rows(table, np.array([5, 5, 3]))
+    array([ True, False,  True])
+    """
+    steps = np.diff(table, axis=1)
+    padding = np.arange(steps.shape[1]) >= (lengths[:, None] - 1)
+    rising = ((steps >= 1) & (steps <= 3)) | padding
+    falling = ((steps <= -1) & (steps >= -3)) | padding
+    return rising.all(axis=1) | falling.all(axis=1)
 
-        # Determine whether the sequence is increasing or decreasing.
-        sign = delta / abs(delta)
 
-        safe = True
-        for i in range(2, len(report)):
-            delta = int((report[i] - report[i - 1]) * sign)
-            if delta > 3 or delta <= 0:
-                safe = False
-                break
+def main_numpy(input_string: str | bytes) -> int:
+    """Calculates the same count as main with NumPy, checking every report
+    at once.
+
+    >>> main_numpy(b'7 6 4 2 1\\n1 2 7 8 9\\n9 7 6 2 1\\n1 3 6 7 9\\n')
+    2
+    """
+    return int(safe_rows(*parse_numpy(input_string)).sum())
+
 
-        if safe:
-            count += 1
+def main_stream(stream: BinaryIO) -> int:
+    """Calculates the number of safe reports, reading them a block at a time.
 
-    return count
+    >>> import io
+    >>> main_stream(io.BytesIO(b'7 6 4 2 1\\n1 2 7 8 9\\n9 7 6 2 1\\n'))
+    1
+    """
+    return sum(is_safe(report)
+               for block in chunks(stream) for report in parse(block))
+
+
+def count_range(path: str | os.PathLike, byte_range: tuple[int, int],
+                check: Callable[[Sequence[int]], bool] = is_safe) -> int:
+    """Counts the reports that pass check in one byte range of a file."""
+    start, end = byte_range
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return sum(map(check, parse(file.read(end - start))))
+
+
+def main_parallel(path: str | os.PathLike, workers: int | None = None,
+                  check: Callable[[Sequence[int]], bool] = is_safe) -> int:
+    """Calculates the same count as main from an input file, in parallel.
+    The file is cut into byte ranges on line boundaries, a few per worker
+    (and more if they would be large), each worker process counts the
+    reports that pass check in its ranges, and the counts are summed.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as file:
+    ...     _ = file.write(b'7 6 4 2 1\\n1 2 7 8 9\\n1 3 6 7 9\\n')
+    ...     file.flush()
+    ...     main_parallel(file.name, workers=2)
+    2
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = max(workers * 4, os.path.getsize(path) // RANGE_SIZE)
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(partial(count_range, path, check=check),
+                            line_ranges(path, parts)))
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--parallel' in sys.argv[1:]:
+        paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+        print(main_parallel(paths[0]))
+    elif '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif '--numpy' in sys.argv[1:]:
+        print(main_numpy(sys.stdin.buffer.read()))
+    else:
+        print(main(sys.stdin.read()))
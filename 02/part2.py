@@ -8,49 +8,98 @@ considered unsafe.
 
 Further, an unsafe list can be made safe by removing at most one element and
 creating a resulting list which is safe. (The "Problem Dampener").
+
+For tolerance studies, --tolerance K prints the number of safe reports when
+0 to K levels may be removed from each:
+
+    python 02/part2.py --tolerance 5 < input.txt
 """
 
+import os
 import sys
-from part1 import parse
-
-
-def check_report(report: list[int]) -> int:
-    """Determines whether a sequence is safe (only increases or decreases by 3
-    or less.) If a sequence is safe, the function returns -1. If unsafe, it
-    returns the index at which the safety error occurred.
-
-    >>> check_report([7, 6, 4, 2, 1])
-    -1
-    >>> check_report([1, 2, 7, 8, 9])
-    1
-    >>> check_report([1, 3, 2, 4, 5])
-    1
-    >>> check_report([1, 2, 4, 5])
-    -1
-    >>> check_report([8, 6, 4, 4, 1])
-    2
-    >>> check_report([8, 6, 4, 1])
-    -1
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import sub
+from pathlib import Path
+from typing import BinaryIO, Sequence
+from part1 import parse, parse_numpy, safe_rows
+from part1 import main_parallel as count_parallel
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.stream import chunks
+
+np = lazy_import('numpy')
+
+
+def min_removals(report: Sequence[int], limit: int = 1, low: int = 1,
+                 high: int = 3) -> int:
+    """Returns the fewest levels that must be removed from a report to leave
+    it only increasing, or only decreasing, by low to high at each step; or
+    limit + 1 if that would take more than limit.
+
+    One pass per direction, without copying the report: fewest[i] is the
+    fewest removals leaving a safe run that ends with level i kept. That run
+    either starts at i (everything before it removed), or continues one
+    ending at some j < i with the levels in between removed, and only the
+    last limit + 1 such j can stay within the limit. Most reports never get
+    that far: removing a level only changes the two steps either side of it,
+    so a report with no steps out of range needs no removals, and a
+    direction with more than 2 * limit can't be fixed.
+
+    >>> min_removals([7, 6, 4, 2, 1]), min_removals([1, 3, 2, 4, 5])
+    (0, 1)
+    >>> min_removals([1, 2, 7, 8, 9]), min_removals([1, 2, 7, 8, 9], limit=3)
+    (2, 2)
+    >>> min_removals([1, 2, 7, 8, 9], limit=3, high=5)
+    0
     """
-    # If unsafe, return False immediately.
-    delta = report[1] - report[0]
-    if abs(delta) > 3 or delta == 0:
-        return 0
-
-    # Determine whether the sequence is increasing or decreasing.
-    sign = delta / abs(delta)
-
-    for i in range(2, len(report)):
-        delta = int((report[i] - report[i-1]) * sign)
-        if delta > 3 or delta <= 0:
-            return i - 1
-
-    return -1
+    steps = list(map(sub, report[1:], report))
+    if steps:
+        smallest, largest = min(steps), max(steps)
+        if (low <= smallest and largest <= high
+                or -high <= smallest and largest <= -low):
+            return 0
+    steps.sort()
+    last = len(report) - 1
+    best = min(len(report), limit + 1)
+    for least, most in ((low, high), (-high, -low)):
+        wrong = (bisect_left(steps, least)
+                 + len(steps) - bisect_right(steps, most))
+        if wrong > 2 * limit:
+            continue
+        fewest: list[int] = []
+        for i, level in enumerate(report):
+            removed = i
+            for j in range(max(i - limit - 1, 0), i):
+                if least <= level - report[j] <= most:
+                    skip = fewest[j] + i - j - 1
+                    if skip < removed:
+                        removed = skip
+            fewest.append(removed)
+            if removed + last - i < best:
+                best = removed + last - i
+    return best
+
+
+def is_safe(report: Sequence[int], removals: int = 1, low: int = 1,
+            high: int = 3) -> bool:
+    """Determines whether a report is safe, or can be made safe by removing
+    at most removals levels.
+
+    >>> is_safe([1, 3, 2, 4, 5])
+    True
+    >>> is_safe([9, 7, 6, 2, 1])
+    False
+    >>> is_safe([9, 7, 6, 2, 1], removals=2)
+    True
+    """
+    return min_removals(report, removals, low, high) <= removals
 
 
-def main(input_string: str) -> int:
+def main(input_string: str, removals: int = 1) -> int:
     """Calculate the number of safe reports in a list, given the Problem
-    Dampener.
+    Dampener (which can remove that many levels from each).
 
     >>> input_string = '''\\
     ... 7 6 4 2 1
@@ -62,33 +111,83 @@ def main(input_string: str) -> int:
     >>> main(input_string)
     4
     """
+    return sum(is_safe(report, removals) for report in parse(input_string))
+
+
+def tolerance(input_string: str, removals: int, low: int = 1,
+              high: int = 3) -> list[int]:
+    """Counts the safe reports when up to 0, 1, ... removals levels can be
+    removed from each, finding each report's fewest removals only once.
+
+    >>> tolerance('9 7 6 2 1\\n1 3 2 4 5\\n1 6 2 7 3 8\\n', 3)
+    [0, 1, 2, 3]
+    """
+    counts = [0] * (removals + 1)
+    for report in parse(input_string):
+        needed = min_removals(report, removals, low, high)
+        if needed <= removals:
+            counts[needed] += 1
+    return list(accumulate(counts))
+
+
+def main_numpy(input_string: str | bytes) -> int:
+    """Calculates the same count as main with NumPy. Every report is checked
+    at once as it is, and then again with each column of levels removed in
+    turn (reports too short to have that column keep their verdict), so
+    there is one whole-array check per level of the longest report.
+
+    >>> main_numpy(b'1 2 7 8 9\\n1 3 2 4 5\\n8 6 4 4 1\\n1 3 6 7 9\\n')
+    3
+    """
+    table, lengths = parse_numpy(input_string)
+    safe = safe_rows(table, lengths)
+    for column in range(table.shape[1]):
+        removed = safe_rows(np.delete(table, column, axis=1), lengths - 1)
+        safe |= removed & (column < lengths)
+    return int(safe.sum())
 
-    reports = parse(input_string)
 
-    count = 0
+def main_stream(stream: BinaryIO) -> int:
+    """Calculates the number of safe reports, given the Problem Dampener,
+    reading them a block at a time.
 
-    for report in reports:
-        result = check_report(report)
+    >>> import io
+    >>> main_stream(io.BytesIO(b'1 2 7 8 9\\n1 3 2 4 5\\n8 6 4 4 1\\n'))
+    2
+    """
+    return sum(is_safe(report)
+               for block in chunks(stream) for report in parse(block))
 
-        # First failure
-        if result != -1:
-            # Remove elements around failure and generate new reports
-            new_reports = []
-            for i in range(-1, 2):
-                new_reports.append(report[:result+i] + report[result+i+1:])
 
-            # If any new report succeeds, break and consider it safe
-            for new_report in new_reports:
-                if check_report(new_report) == -1:
-                    count += 1
-                    break
-        else:
-            count += 1
+def main_parallel(path: str | os.PathLike, workers: int | None = None) -> int:
+    """Calculates the same count as main from an input file, in parallel
+    (see part1.main_parallel).
 
-    return count
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as file:
+    ...     _ = file.write(b'1 2 7 8 9\\n1 3 2 4 5\\n8 6 4 4 1\\n')
+    ...     file.flush()
+    ...     main_parallel(file.name, workers=2)
+    2
+    """
+    return count_parallel(path, workers, is_safe)
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--parallel' in sys.argv[1:]:
+        paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+        print(main_parallel(paths[0]))
+    elif '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif '--numpy' in sys.argv[1:]:
+        print(main_numpy(sys.stdin.buffer.read()))
+    elif '--tolerance' in sys.argv[1:]:
+        # One line per number of removals allowed: removals, safe reports
+        k = int(sys.argv[sys.argv.index('--tolerance') + 1])
+        for removals, count in enumerate(tolerance(sys.stdin.read(), k)):
+            print(removals, count)
+    else:
+        print(main(sys.stdin.read()))
@@ -7,9 +7,19 @@ the sum of the products.
 
 import sys
 import re
+from pathlib import Path
+from typing import BinaryIO
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.stream import CHUNK_SIZE, finditer, mapped
 
-def main(input_string: str) -> int:
+# Matched against bytes, so a memory-mapped input is searched in place
+MUL = re.compile(rb'mul\((\d+),(\d+)\)')
+# The start of a mul() cut off by the end of a block, e.g. b'mul(12,'
+MUL_START = re.compile(rb'm(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?\Z')
+
+
+def main(input_string: str | bytes) -> int:
     """Calculates the sum of mul() multiplication commands in a string.
 
     >>> main('xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))')
@@ -17,15 +27,39 @@ def main(input_string: str) -> int:
 
     (2 * 4 + 5 * 5 + 11 * 8 + 8 * 5)
     """
+    if isinstance(input_string, str):
+        input_string = input_string.encode()
     total = 0
-    results = re.findall(r'mul\((\d+),(\d+)\)', input_string)
+    results = MUL.findall(input_string)
     for result in results:
         total += (int(result[0]) * int(result[1]))
 
     return total
 
 
+def main_stream(stream: BinaryIO, size: int = CHUNK_SIZE) -> int:
+    """Calculates the same sum as main, reading the input size bytes at a
+    time, so memory stays the same however big it is.
+
+    >>> import io
+    >>> data = (b'xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)'
+    ...         b'+mul(32,64]then(mul(11,8)')
+    >>> main_stream(io.BytesIO(data), size=4)
+    121
+    """
+    return sum(int(match.group(1)) * int(match.group(2))
+               for match in finditer(stream, MUL, MUL_START, size))
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(sys.stdin.buffer.read()))
@@ -7,11 +7,81 @@ and returns the sum of the products.
 """
 
 
+import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+from part1 import MUL
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.stream import CHUNK_SIZE, cut_ranges, finditer, mapped
 
-def main(input_string: str) -> int:
+# Capture either do(), don't(), or mul(x, y). Matched against bytes, so a
+# memory-mapped input is searched in place.
+PATTERN = re.compile(rb"do\(\)|don't\(\)|(mul)\((\d+),(\d+)\)")
+# The start of any of them cut off by the end of a block, e.g. b"don'"
+PATTERN_START = re.compile(
+    rb"(?:d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?"
+    rb"|m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?)\Z")
+# A byte that no instruction contains, so none can span it
+OUTSIDE = re.compile(rb"[^\d(),'dlmnotu]")
+# Bytes of input scanned per task by main_parallel, at most
+RANGE_SIZE = 1 << 24
+
+
+class Summary(NamedTuple):
+    """What a stretch of input adds to the total if mul() is enabled at its
+    start, and if it isn't, and whether mul() is enabled at its end (None
+    if it has no do() or don't() to change that)."""
+    enabled: int = 0
+    disabled: int = 0
+    state: bool | None = None
+
+    def then(self, other: 'Summary') -> 'Summary':
+        """Summarises this stretch followed by other. This is associative,
+        so stretches can be summarised separately and folded in order.
+
+        >>> first = summarize(b"mul(2,3)don't()")
+        >>> first.then(summarize(b'mul(4,5)'))
+        Summary(enabled=6, disabled=0, state=False)
+        >>> summarize(b'mul(4,5)do()').then(first)
+        Summary(enabled=26, disabled=6, state=False)
+        """
+        return Summary(
+            self.enabled + (other.disabled if self.state is False
+                            else other.enabled),
+            self.disabled + (other.enabled if self.state else other.disabled),
+            self.state if other.state is None else other.state)
+
+
+def summarize(data: bytes) -> Summary:
+    """Summarises one stretch of input, which must not cut an instruction in
+    two.
+
+    >>> summarize(b"mul(2,3)do()mul(4,5)don't()mul(6,7)")
+    Summary(enabled=26, disabled=20, state=False)
+    """
+    enabled = disabled = 0
+    state = None
+    for match in PATTERN.finditer(data):
+        if match.group(0) == b"don't()":
+            state = False
+        elif match.group(0) == b'do()':
+            state = True
+        else:
+            product = int(match.group(2)) * int(match.group(3))
+            # Only a do() in this stretch enables it whatever the start
+            if state is not False:
+                enabled += product
+            if state:
+                disabled += product
+    return Summary(enabled, disabled, state)
+
+
+def main(input_string: str | bytes) -> int:
     """Calculates the sum of mul() multiplication commands in a string, unless
     disabled by a don't()-do() span.
 
@@ -22,27 +92,125 @@ def main(input_string: str) -> int:
     the mul(8,5) following do() is also counted. 2 * 4 + 8 * 5 = 48.
     """
 
-    # Capture either do(), don't(), or mul(x, y)
-    pattern = r"do\(\)|don't\(\)|(mul)\((\d+),(\d+)\)"
-    results = re.finditer(pattern, input_string)
+    if isinstance(input_string, str):
+        input_string = input_string.encode()
+    results = PATTERN.finditer(input_string)
 
     total = 0
 
     # Whether or not to count a product
     do = True
     for result in results:
-        if result.group(0) == "don't()":
+        if result.group(0) == b"don't()":
             do = False
-        elif result.group(0) == 'do()':
+        elif result.group(0) == b'do()':
             do = True
         # We should never be able to get here without a group(1)
-        elif result.group(1) == 'mul' and do:
+        elif result.group(1) == b'mul' and do:
             total += int(result.group(2)) * int(result.group(3))
 
     return total
 
 
+def main_stream(stream: BinaryIO, size: int = CHUNK_SIZE) -> int:
+    """Calculates the same sum as main, reading the input size bytes at a
+    time. Instructions cut in two by the end of a block are carried over,
+    and so is whether mul() is enabled.
+
+    >>> import io
+    >>> data = (b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)"
+    ...         b"+mul(32,64](mul(11,8)undo()?mul(8,5))")
+    >>> main_stream(io.BytesIO(data), size=3)
+    48
+    """
+    total = 0
+    do = True
+    for match in finditer(stream, PATTERN, PATTERN_START, size):
+        if match.group(0) == b"don't()":
+            do = False
+        elif match.group(0) == b'do()':
+            do = True
+        elif do:
+            total += int(match.group(2)) * int(match.group(3))
+    return total
+
+
+def main_scanner(input_string: str | bytes) -> int:
+    """Calculates the same sum as main by jumping from one don't() to the
+    next do() with bytes.find, and only looking for mul() in between, where
+    it is enabled. Those stretches are searched with findall, which returns
+    the digits as plain bytes rather than a Match per instruction.
+
+    >>> main_scanner("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)"
+    ...              "+mul(32,64](mul(11,8)undo()?mul(8,5))")
+    48
+    """
+    if isinstance(input_string, str):
+        input_string = input_string.encode()
+    total = 0
+    start = 0
+    while True:
+        stop = input_string.find(b"don't()", start)
+        if stop < 0:
+            stop = len(input_string)
+        total += sum(int(x) * int(y)
+                     for x, y in MUL.findall(input_string, start, stop))
+        start = input_string.find(b'do()', stop)
+        if start < 0:
+            return total
+
+
+def summarize_range(path: str | os.PathLike,
+                    byte_range: tuple[int, int]) -> Summary:
+    """Summarises one byte range of a file."""
+    start, end = byte_range
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return summarize(file.read(end - start))
+
+
+def main_parallel(path: str | os.PathLike, workers: int | None = None) -> int:
+    """Calculates the same sum as main from an input file, in parallel.
+    Whether mul() is enabled carries from one instruction to the next, but
+    a stretch of input can be summarised without knowing it (see Summary),
+    and the summaries folded in order. The file is cut into byte ranges, a
+    few per worker (and more if they would be large), at bytes that can't
+    be inside an instruction, each worker process summarises its ranges,
+    and the summaries are folded starting enabled.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as file:
+    ...     _ = file.write(b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)"
+    ...                    b"+mul(32,64](mul(11,8)undo()?mul(8,5))")
+    ...     file.flush()
+    ...     main_parallel(file.name, workers=2)
+    48
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = max(workers * 4, os.path.getsize(path) // RANGE_SIZE)
+    with ProcessPoolExecutor(workers) as pool:
+        summaries = pool.map(partial(summarize_range, path),
+                             cut_ranges(path, parts, OUTSIDE))
+        return reduce(Summary.then, summaries, Summary()).enabled
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if '--parallel' in sys.argv[1:]:
+        print(main_parallel(paths[0]))
+    elif '--scanner' in sys.argv[1:]:
+        if paths:
+            with mapped(paths[0]) as data:
+                print(main_scanner(data))
+        else:
+            print(main_scanner(sys.stdin.buffer.read()))
+    elif '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    elif paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(sys.stdin.buffer.read()))
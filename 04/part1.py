@@ -5,13 +5,27 @@ directions, then returns how many instances of the word were found in the
 search.
 """
 
+from __future__ import annotations
+
 import sys
-import numpy as np
-from numpy.typing import NDArray
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.grid import parse_grid
+from aoc.lazy import lazy_import
+from aoc.stream import mapped
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import('numpy')
 
-def parse(input_string: str) -> NDArray[np.str_]:
-    """Parses a block of text into a 2D Numpy array of characters.
+
+def parse(input_string: str | bytes) -> NDArray[np.uint8]:
+    """Parses a block of text into a 2D Numpy array of character codes. Bytes
+    (e.g. a memory-mapped file) are viewed in place.
 
     >>> input_string = '''\\
     ... ABCD
@@ -19,21 +33,26 @@ def parse(input_string: str) -> NDArray[np.str_]:
     ... IJKL'''
 
     >>> parse(input_string)
-    array([['A', 'B', 'C', 'D'],
-           ['E', 'F', 'G', 'H'],
-           ['I', 'J', 'K', 'L']], dtype='<U1')
+    array([[65, 66, 67, 68],
+           [69, 70, 71, 72],
+           [73, 74, 75, 76]], dtype=uint8)
     """
-    return np.array([list(x) for x in input_string.split('\n') if x != ''])
+    return parse_grid(input_string)
+
 
+def text(cells: NDArray[np.uint8]) -> str:
+    """Turns a run of character codes back into a string."""
+    return cells.tobytes().decode()
 
-def np_strings(array: NDArray[np.str_], i: int, j: int, l: int) -> list[str]:
+
+def np_strings(array: NDArray[np.uint8], i: int, j: int, l: int) -> list[str]:
     """Returns all substrings of a given length from a Numpy array, starting at
     position (i, j), in 8 cardinal directions (like a word search).
 
-    >>> array = np.array([\\
-    ... ['A', 'B', 'C', 'D'],
-    ... ['E', 'F', 'G', 'H'],
-    ... ['I', 'J', 'K', 'L']])
+    >>> array = parse('''\\
+    ... ABCD
+    ... EFGH
+    ... IJKL''')
 
     >>> np_strings(array, 1, 1, 2)
     ['FG', 'FK', 'FJ', 'FI', 'FE', 'FA', 'FB', 'FC']
@@ -51,33 +70,33 @@ def np_strings(array: NDArray[np.str_], i: int, j: int, l: int) -> list[str]:
 
     # East
     if j + l <= width:
-        s.append(''.join(array[i, j:j+l]))
+        s.append(text(array[i, j:j+l]))
     # Southeast
     if i + l <= height and j + l <= width:
-        s.append(''.join(array[i:i+l, j:j+l].diagonal()))
+        s.append(text(array[i:i+l, j:j+l].diagonal()))
     # South
     if i + l <= height:
-        s.append(''.join(array[i:i+l, j]))
+        s.append(text(array[i:i+l, j]))
     # Southwest
     if i + l <= height and j - l >= -1:
-        s.append(''.join(np.fliplr(array[i:i+l, j-l+1:j+1]).diagonal()))
+        s.append(text(np.fliplr(array[i:i+l, j-l+1:j+1]).diagonal()))
     # West
     if j - l >= -1:
-        s.append(''.join(array[i, j-l+1:j+1])[::-1])
+        s.append(text(array[i, j-l+1:j+1])[::-1])
     # Northwest
     if i - l >= -1 and j - l >= -1:
-        s.append(''.join(array[i-l+1:i+1, j-l+1:j+1].diagonal())[::-1])
+        s.append(text(array[i-l+1:i+1, j-l+1:j+1].diagonal())[::-1])
     # North
     if i - l >= -1:
-        s.append(''.join(array[i-l+1:i+1, j])[::-1])
+        s.append(text(array[i-l+1:i+1, j])[::-1])
     # Northeast
     if i - l >= -1 and j + l <= width:
-        s.append(''.join(np.flipud(array[i-l+1:i+1, j:j+l]).diagonal()))
+        s.append(text(np.flipud(array[i-l+1:i+1, j:j+l]).diagonal()))
 
     return s
 
 
-def main(input_string: str, substring: str) -> int:
+def main(input_string: str | bytes, substring: str) -> int:
     """Caunts the number of times a substring appears in a string either down,
     across, or diagonally (like a word search).
 
@@ -98,22 +117,26 @@ def main(input_string: str, substring: str) -> int:
     """
 
     array = parse(input_string)
-    height, width = array.shape
     length = len(substring)
 
     total = 0
 
-    for i in (range(0, height)):
-        for j in range(0, width):
-            if array[i, j] != substring[0] and array[i, j] != substring[-1]:
-                continue
-            substrings = np_strings(array, i, j, length)
-            total += substrings.count(substring)
+    # Only cells holding the first or last letter can start a match
+    ends = (array == ord(substring[0])) | (array == ord(substring[-1]))
+    for i, j in zip(*np.nonzero(ends)):
+        substrings = np_strings(array, i, j, length)
+        total += substrings.count(substring)
 
     return total
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read(), 'XMAS'))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data, 'XMAS'))
+    else:
+        print(main(sys.stdin.buffer.read(), 'XMAS'))
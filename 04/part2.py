@@ -5,20 +5,32 @@ directions, then returns how many instances of the word were found in an X
 pattern.
 """
 
+from __future__ import annotations
+
 import sys
-import numpy as np
-from numpy.typing import NDArray
-from part1 import parse
+from pathlib import Path
+from typing import TYPE_CHECKING
+from part1 import parse, text
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.stream import mapped
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import('numpy')
 
 
-def np_xstrings(array: NDArray[np.str_], i: int, j: int, l: int) -> list[str]:
+def np_xstrings(array: NDArray[np.uint8], i: int, j: int, l: int) -> list[str]:
     """Returns the diagonal substrings of a given length from a Numpy array
     with the northwest corner at (i, j).
 
-    >>> array = np.array([\\
-    ... ['A', 'B', 'C', 'D'],
-    ... ['E', 'F', 'G', 'H'],
-    ... ['I', 'J', 'K', 'L']])
+    >>> array = parse('''\\
+    ... ABCD
+    ... EFGH
+    ... IJKL''')
 
     >>> np_xstrings(array, 1, 1, 2)
     ['FK', 'GJ', 'KF', 'JG']
@@ -33,13 +45,13 @@ def np_xstrings(array: NDArray[np.str_], i: int, j: int, l: int) -> list[str]:
         return []
 
     subarray = array[i:i+l, j:j+l]
-    diag1 = ''.join(subarray.diagonal())
-    diag2 = ''.join(np.fliplr(subarray).diagonal())
+    diag1 = text(subarray.diagonal())
+    diag2 = text(np.fliplr(subarray).diagonal())
 
     return [diag1, diag2, diag1[::-1], diag2[::-1]]
 
 
-def main(input_string: str, substring: str) -> int:
+def main(input_string: str | bytes, substring: str) -> int:
     """Counts the number of times a substring appears in a string in an X
     formation, i.e. diagonally, either forwards or backwards, crossing each
     other.
@@ -66,18 +78,24 @@ def main(input_string: str, substring: str) -> int:
 
     total = 0
 
-    for i in range(0, height - length + 1):
-        for j in range(0, width - length + 1):
-            if array[i, j] != substring[0] and array[i, j] != substring[-1]:
-                continue
-            substrings = np_xstrings(array, i, j, length)
-            # An X will have at least 2 counts (4 if word is a palindrome)
-            if substrings.count(substring) >= 2:
-                total += 1
+    # Only cells holding the first or last letter can be the corner of an X
+    corners = array[:height - length + 1, :width - length + 1]
+    ends = (corners == ord(substring[0])) | (corners == ord(substring[-1]))
+    for i, j in zip(*np.nonzero(ends)):
+        substrings = np_xstrings(array, i, j, length)
+        # An X will have at least 2 counts (4 if word is a palindrome)
+        if substrings.count(substring) >= 2:
+            total += 1
     return total
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read(), 'MAS'))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data, 'MAS'))
+    else:
+        print(main(sys.stdin.buffer.read(), 'MAS'))
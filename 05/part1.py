@@ -2,6 +2,11 @@
 """
 
 import sys
+from itertools import pairwise
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.parsing import int_rows, ints
 
 
 def parse(input_string: str) -> tuple[list[tuple[int, ...]], list[list[int]]]:
@@ -19,15 +24,13 @@ def parse(input_string: str) -> tuple[list[tuple[int, ...]], list[list[int]]]:
     >>> parse(input_string)
     ([(47, 53), (97, 13)], [[75, 47, 61, 53, 29], [97, 61, 53, 29, 13]])
     """
-    rules = []
-    pages_list = []
-    rules_lines, pages_lines = [x.split() for x in input_string.split('\n\n')]
+    rules_section, pages_section = input_string.split('\n\n')
 
-    for line in rules_lines:
-        rules.append(tuple(int(x) for x in line.split('|')))
+    values = ints(rules_section)
+    rules: list[tuple[int, ...]] = list(zip(values[0::2], values[1::2]))
 
-    for line in pages_lines:
-        pages_list.append([int(x) for x in line.split(',')])
+    values, offsets = int_rows(pages_section)
+    pages_list = [values[i:j] for i, j in pairwise(offsets)]
 
     return rules, pages_list
 
@@ -86,6 +89,7 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
     print(main(sys.stdin.read()))
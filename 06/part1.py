@@ -7,6 +7,10 @@ exits the field, the Guard will stop moving.
 """
 
 import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
 
 
 class Guard:
@@ -31,6 +35,8 @@ class Guard:
     def move(self, direction: str):
         """Moves the guard as far as possible in the specified direction, until
         the guard leaves the field or visits a position already visited."""
+        if instrument.enabled:
+            instrument.count('Guard.move calls')
         # Stop if we return to a position we've been before
         if self.pos in self.visits[direction]:
             self.go = False
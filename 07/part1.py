@@ -4,19 +4,23 @@ Oh boy, here I go recursin' again.
 """
 
 import sys
-import re
-from typing import Iterator
+from itertools import pairwise
+from pathlib import Path
+from typing import BinaryIO, Iterator
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
+from aoc.parsing import int_rows
+from aoc.stream import chunks
 
-def parse(input_string: str) -> Iterator[tuple[int, list[int]]]:
+
+def parse(input_string: str | bytes) -> Iterator[tuple[int, list[int]]]:
     """Parses the input and returns a generator function for the result and the
     list of integers.
     """
-    lines = re.finditer(r'(\d+): ([\d ]+)', input_string)
-    for line in lines:
-        n = int(line.group(1))
-        to_test = [int(x) for x in line.group(2).split()]
-        yield n, to_test
+    values, offsets = int_rows(input_string)
+    for i, j in pairwise(offsets):
+        yield values[i], values[i + 1:j]
 
 
 def is_valid(n: int, to_test: list[int]) -> bool:
@@ -44,6 +48,8 @@ def is_valid(n: int, to_test: list[int]) -> bool:
     True
     """
 
+    if instrument.enabled:
+        instrument.count('is_valid calls')
     # BASE CASE
     if len(to_test) == 1:
         if n == to_test[0]:
@@ -65,7 +71,18 @@ def main(input_string: str) -> int:
     return sum(x[0] for x in parse(input_string) if is_valid(*x))
 
 
+def main_stream(stream: BinaryIO) -> int:
+    """Returns the sum of all valid numbers, reading them a block at a time.
+    """
+    return sum(x[0] for block in chunks(stream)
+               for x in parse(block) if is_valid(*x))
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    else:
+        print(main(sys.stdin.read()))
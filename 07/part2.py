@@ -2,8 +2,14 @@
 """
 
 import sys
+from pathlib import Path
+from typing import BinaryIO
 from part1 import parse
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
+from aoc.stream import chunks
+
 
 def is_valid(n: int, to_test: list[int]) -> bool:
     """A recursive function to test if a list of integers can equate to n using
@@ -30,6 +36,8 @@ def is_valid(n: int, to_test: list[int]) -> bool:
     True
     """
 
+    if instrument.enabled:
+        instrument.count('is_valid calls')
     # BASE CASE
     if len(to_test) == 1:
         if n == to_test[0]:
@@ -60,7 +68,18 @@ def main(input_string: str) -> int:
     return sum(x[0] for x in parse(input_string) if is_valid(*x))
 
 
+def main_stream(stream: BinaryIO) -> int:
+    """Returns the sum of all valid numbers, reading them a block at a time.
+    """
+    return sum(x[0] for block in chunks(stream)
+               for x in parse(block) if is_valid(*x))
+
+
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
-    print(main(sys.stdin.read()))
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    else:
+        print(main(sys.stdin.read()))
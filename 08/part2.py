@@ -57,6 +57,7 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    import doctest
-    doctest.testmod()
+    if '--test' in sys.argv[1:]:
+        import doctest
+        doctest.testmod()
     print(main(sys.stdin.read()))
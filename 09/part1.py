@@ -1,7 +1,14 @@
 """Day 9: Disk Fragmenter, Part 1
 """
 
-from sys import stdin
+import sys
+from sys import argv, stdin
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.stream import mapped
+
+ZERO = ord('0')
 
 
 def map_disk(sequence: list[int]) -> list[tuple[int, int]]:
@@ -118,11 +125,32 @@ def tests():
     assert calculate_checksum(filesystem) == 1928
 
 
-def main():
-    """Print the filesystem checksum based on stdin input."""
-    disk = [int(x) for x in stdin.read().splitlines()[0]]
-    print(calculate_checksum(transform_filesystem(map_disk(disk))))
+def parse(input_string: str | bytes) -> list[int]:
+    """Parses the first line of the input into a list of digits. Bytes (e.g.
+    a memory-mapped file) are read in place, without decoding or splitting.
+
+    >>> parse('12345\\n') == parse(b'12345\\n') == [1, 2, 3, 4, 5]
+    True
+    """
+    if isinstance(input_string, str):
+        return [int(x) for x in input_string.splitlines()[0]]
+    end = input_string.find(b'\n')
+    with memoryview(input_string) as view:
+        return [x - ZERO for x in view[:end if end >= 0 else len(view)]]
+
+
+def main(input_string: str | bytes) -> int:
+    """Calculates the filesystem checksum for a disk map."""
+    disk = parse(input_string)
+    return calculate_checksum(transform_filesystem(map_disk(disk)))
+
 
 if __name__ == '__main__':
-    tests()
-    main()
+    if '--test' in argv[1:]:
+        tests()
+    paths = [x for x in argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(stdin.buffer.read()))
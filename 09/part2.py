@@ -1,8 +1,13 @@
 """Day 9: Disk Fragmenter, Part 2
 """
 
-from sys import stdin
-from part1 import map_disk
+import sys
+from sys import argv, stdin
+from pathlib import Path
+from part1 import map_disk, parse
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.stream import mapped
 
 
 def transform_filesystem(slices: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -57,12 +62,18 @@ def tests():
     assert calculate_checksum(filesystem) == 2858
 
 
-def main():
-    """Print the filesystem checksum based on stdin input."""
-    disk = [int(x) for x in stdin.read().splitlines()[0]]
-    print(calculate_checksum(transform_filesystem(map_disk(disk))))
+def main(input_string: str | bytes) -> int:
+    """Calculates the filesystem checksum for a disk map."""
+    disk = parse(input_string)
+    return calculate_checksum(transform_filesystem(map_disk(disk)))
 
 
 if __name__ == '__main__':
-    tests()
-    main()
+    if '--test' in argv[1:]:
+        tests()
+    paths = [x for x in argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(stdin.buffer.read()))
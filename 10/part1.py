@@ -1,57 +1,68 @@
 """Day 10: Hoof It, Part 1
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.grid import adjacency, parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
 
 
 class TopoMap:
-    """Class for the topographic map."""
+    """Class for the topographic map. Cells are numbered row * width + column.
+    """
     def __init__(self, input_string: str):
-        lines = input_string.splitlines()
-        self.topomap = np.array([[int(x) for x in line] for line in lines])
+        self.topomap = parse_grid(input_string).astype(np.int16) - ord('0')
         self.shape = self.topomap.shape
         self.height, self.width = self.shape
-        self.routemap = np.zeros(self.shape, dtype=int)
-        self.zeros = [(int(i), int(j)) for i, j in
-                      np.column_stack(np.where(self.topomap == 0))]
+        # Uphill neighbours of every cell, i.e. those exactly one higher
+        starts, targets = adjacency(self.topomap, lambda a, b: b == a + 1)
+        self.starts, self.targets = starts.tolist(), targets.tolist()
+        self.heights = self.topomap.ravel().tolist()
+        self.routemap: dict[int, int] = {}
+        self.zeros = np.flatnonzero(self.topomap == 0).tolist()
         self.score = 0
 
-    def get_neighbors(self, coord: tuple[int, int]) -> list[tuple[int, int]]:
-        """Returns valid neighbor coordinates for a specified coordinate."""
-        neighbors = []
-        for offset in ((0, 1), (-1, 0), (0, -1), (1, 0)):
-            n = tuple(map(sum, zip(coord, offset)))
-            if (0 <= n[0] < self.height) and (0 <= n[1] < self.width):
-                neighbors.append(n)
-        return neighbors
+    def get_neighbors(self, cell: int) -> list[int]:
+        """Returns the cells one step uphill from a cell."""
+        return self.targets[self.starts[cell]:self.starts[cell + 1]]
 
-    def update_routemap(self, coord: tuple[int, int]) -> int:
+    def update_routemap(self, cell: int) -> int:
         """Updates the routemap, which serves as the cache for the routes. Each
         cell is equal to the number of unique 9s that cell can reach. (If a 9
         has already been found, it is not counted again.)
         """
 
         # Reached destination
-        if self.topomap[coord] == 9 and self.routemap[coord] == 0:
-            self.routemap[coord] = 1
+        if self.heights[cell] == 9 and cell not in self.routemap:
+            self.routemap[cell] = 1
             return 1
         # We've already checked this location
-        if self.routemap[coord] != 0:
+        if self.routemap.get(cell, 0) != 0:
             return 0
 
-        n = self.get_neighbors(coord)
-        n = [x for x in n if self.topomap[x] == self.topomap[coord] + 1]
+        n = self.get_neighbors(cell)
 
         # This is a dead end:
         if len(n) == 0:
             return 0
-        if self.topomap[coord] == 0:
-            self.routemap = np.zeros(self.shape, dtype=int)
-            self.routemap[coord] += sum(self.update_routemap(x) for x in n)
-            self.score += self.routemap[coord]
-        self.routemap[coord] += sum(self.update_routemap(x) for x in n)
-        return self.routemap[coord]
+        if self.heights[cell] == 0:
+            self.routemap = {}
+            self.routemap[cell] = sum(self.update_routemap(x) for x in n)
+            self.score += self.routemap[cell]
+        self.routemap[cell] = (self.routemap.get(cell, 0) +
+                               sum(self.update_routemap(x) for x in n))
+        return self.routemap[cell]
 
 
 def tests():
@@ -79,5 +90,6 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
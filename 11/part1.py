@@ -1,7 +1,12 @@
 """Day 11: Plutonian Pebbles, Part 1
 """
 
-from sys import stdin
+import sys
+from sys import argv, stdin
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
 
 
 def init_pebbles(input_string: str) -> dict[int, int]:
@@ -31,6 +36,8 @@ def blink(pebble: int) -> list[int]:
 
 def blink_all_pebbles(pebbles: dict[int, int]) -> dict[int, int]:
     """Performs the blink operating for all pebbles in a map."""
+    if instrument.enabled:
+        instrument.count('blink calls', len(pebbles))
     new_pebbles: dict[int, int] = {}
     for n in pebbles.keys():
         for blinked in blink(n):
@@ -61,5 +68,6 @@ def main(input_string: str, count: int) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in argv[1:]:
+        tests()
     print(main(stdin.read().splitlines()[0], 25))
@@ -1,61 +1,73 @@
 """Day 12: Garden Groups, Part 1
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.grid import adjacency, parse_grid
+from aoc.lazy import lazy_import
+from aoc.stream import mapped
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
 
 
 class Field:
-    """A class to represent the field of crops."""
-    def __init__(self, input_string: str):
-        lines = input_string.splitlines()
-        self.field = np.array([list(line) for line in lines])
-        self.area: dict[tuple[int, int], int] = {}
-        self.perimeter: dict[tuple[int, int], int] = {}
+    """A class to represent the field of crops. Cells are numbered
+    row * width + column.
+    """
+    def __init__(self, input_string: str | bytes):
+        self.field = parse_grid(input_string)
+        self.area: dict[int, int] = {}
+        self.perimeter: dict[int, int] = {}
         # Keeps track of the "parent node" for each group, i.e. which cell a
         # cell stems from
-        self.parent: dict[tuple[int, int], tuple[int, int]] = {}
+        self.parent: list[int] = []
 
-    def find_root(self, coord: tuple[int, int]) -> tuple[int, int]:
-        """Finds the root of a coordinate."""
-        if self.parent[coord] != coord:
-            self.parent[coord] = self.find_root(self.parent[coord])
-        return self.parent[coord]
+    def find_root(self, cell: int) -> int:
+        """Finds the root of a cell."""
+        parent = self.parent
+        while parent[cell] != cell:
+            # Path halving: point each visited cell at its grandparent
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
 
-    def merge_regions(self, coord1: tuple[int, int], coord2: tuple[int, int]):
+    def merge_regions(self, cell1: int, cell2: int):
         """Merge two groups together by setting their root to be the same."""
-        root1 = self.find_root(coord1)
-        root2 = self.find_root(coord2)
+        root1 = self.find_root(cell1)
+        root2 = self.find_root(cell2)
         if root1 != root2:
             self.parent[root2] = root1
 
     def group_field(self):
         """Generates groups of crops"""
-        directions = ((-1, 0), (0, -1))     # Only check north and west
-        for (r, c), crop in np.ndenumerate(self.field):
-            coord = (r, c)
-            self.parent[coord] = coord
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if nr >= 0 and nc >= 0:
-                    if self.field[nr, nc] == crop:
-                        self.merge_regions(coord, (nr, nc))
+        # Only check north and west
+        starts, targets = adjacency(self.field, np.equal,
+                                    offsets=((-1, 0), (0, -1)))
+        starts, targets = starts.tolist(), targets.tolist()
+        self.parent = list(range(self.field.size))
+        for cell in range(self.field.size):
+            for neighbor in targets[starts[cell]:starts[cell + 1]]:
+                self.merge_regions(cell, neighbor)
 
     def calculate(self) -> int:
         """Calculates the total cost of fencing."""
-        directions = ((0, 1), (1, 0), (0, -1), (-1, 0))
-        rows, cols = self.field.shape
+        # Every side not shared with the same crop needs a fence
+        starts, _ = adjacency(self.field, np.equal)
+        fences = (4 - np.diff(starts)).tolist()
 
-        for (r, c), crop in np.ndenumerate(self.field):
-            root = self.find_root((r, c))
+        for cell, fence in enumerate(fences):
+            root = self.find_root(cell)
             self.area[root] = self.area.get(root, 0) + 1
-            self.perimeter[root] = self.perimeter.get(root, 0)
-
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if (not (0 <= nr < rows and 0 <= nc < cols) or
-                        self.field[nr, nc] != crop):
-                    self.perimeter[root] += 1
+            self.perimeter[root] = self.perimeter.get(root, 0) + fence
         return sum(self.area[x] * self.perimeter[x] for x in self.area)
 
 
@@ -71,7 +83,7 @@ def tests():
     assert field.calculate() == 772
 
 
-def main(input_string: str) -> int:
+def main(input_string: str | bytes) -> int:
     """Calculates the total cost for the input string."""
     field = Field(input_string)
     field.group_field()
@@ -79,5 +91,11 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
-    print(main(stdin.read()))
+    if '--test' in sys.argv[1:]:
+        tests()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(stdin.buffer.read()))
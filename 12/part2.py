@@ -1,10 +1,23 @@
 """Day 12: Garden Groups, Part 1
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING
 from part1 import Field
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.lazy import lazy_import
+from aoc.stream import mapped
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
+
 
 class FieldPart2(Field):
     """A class to represent the field of crops."""
@@ -15,7 +28,7 @@ class FieldPart2(Field):
         rows, cols = self.field.shape
 
         for (r, c), crop in np.ndenumerate(self.field):
-            root = self.find_root((r, c))
+            root = self.find_root(r * cols + c)
             self.area[root] = self.area.get(root, 0) + 1
             self.perimeter[root] = self.perimeter.get(root, 0)
 
@@ -59,7 +72,7 @@ def tests():
     assert field.calculate() == 436
 
 
-def main(input_string: str) -> int:
+def main(input_string: str | bytes) -> int:
     """Calculates the total cost for the input string."""
     field = FieldPart2(input_string)
     field.group_field()
@@ -67,5 +80,11 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
-    print(main(stdin.read()))
+    if '--test' in sys.argv[1:]:
+        tests()
+    paths = [x for x in sys.argv[1:] if not x.startswith('--')]
+    if paths:
+        with mapped(paths[0]) as data:
+            print(main(data))
+    else:
+        print(main(stdin.buffer.read()))
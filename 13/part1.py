@@ -26,37 +26,31 @@ Once j is known, i can be found by plugging it into the first equation:
     i = (Px - Bx * j) / Ax
 """
 
-import re
+import sys
 from sys import stdin
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.parsing import ints
 
-def parse(input_string: str) -> tuple[tuple[int, int],
-                                      tuple[int, int],
-                                      tuple[int, int]]:
-    """Parses the input string in the following form into a tuple of tuples of
-    integers:
+
+def parse(input_string: str) -> list[tuple[tuple[int, int],
+                                           tuple[int, int],
+                                           tuple[int, int]]]:
+    """Parses the input string, made of blocks in the following form, into a
+    list of claw machines:
 
     Button A: X+94, Y+34
     Button B: X+22, Y+67
     Prize: X=8400, Y=5400
 
-    Returns (94, 34, 22, 67, 8400, 5400)
+    Each block becomes ((94, 34), (22, 67), (8400, 5400)).
     """
-
-    a_regex = re.compile(r"Button A: X\+(\d+), Y\+(\d+)")
-    b_regex = re.compile(r"Button B: X\+(\d+), Y\+(\d+)")
-    p_regex = re.compile(r"Prize: X=(\d+), Y=(\d+)")
-
-    a_match = a_regex.search(input_string)
-    b_match = b_regex.search(input_string)
-    p_match = p_regex.search(input_string)
-    if a_match is None or b_match is None or p_match is None:
+    values = ints(input_string)
+    if len(values) % 6 != 0:
         raise ValueError("Invalid input string")
-    button_a = (int(a_match.group(1)), int(a_match.group(2)))
-    button_b = (int(b_match.group(1)), int(b_match.group(2)))
-    prize = (int(p_match.group(1)), int(p_match.group(2)))
-
-    return button_a, button_b, prize
+    return [((a_x, a_y), (b_x, b_y), (p_x, p_y))
+            for a_x, a_y, b_x, b_y, p_x, p_y in zip(*[iter(values)] * 6)]
 
 
 def solve(button_a: tuple[int, int],
@@ -94,14 +88,10 @@ def tests():
 
 def main(input_string: str) -> int:
     """Solves all puzzle inputs in a string"""
-    total_cost = 0
-    lines = input_string.splitlines()
-    for i in range(0, len(lines), 4):
-        button_a, button_b, prize = parse('\n'.join(lines[i:i+4]))
-        total_cost += solve(button_a, button_b, prize)
-    return total_cost
+    return sum(solve(*machine) for machine in parse(input_string))
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
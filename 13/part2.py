@@ -1,6 +1,6 @@
 """Day 13: Claw Contraptions, Part 2"""
 
-from sys import stdin
+from sys import argv, stdin
 from part1 import parse, solve
 
 
@@ -26,14 +26,13 @@ def tests():
 def main(input_string: str) -> int:
     """Solves all puzzle inputs in a string"""
     total_cost = 0
-    lines = input_string.splitlines()
-    for i in range(0, len(lines), 4):
-        button_a, button_b, prize = parse('\n'.join(lines[i:i+4]))
+    for button_a, button_b, prize in parse(input_string):
         prize = (10000000000000 + prize[0], 10000000000000 + prize[1])
         total_cost += solve(button_a, button_b, prize)
     return total_cost
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in argv[1:]:
+        tests()
     print(main(stdin.read()))
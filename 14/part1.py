@@ -1,19 +1,33 @@
 """Day 14: Restroom Redoubt, Part 1"""
 
+from __future__ import annotations
+
+import io
+import sys
 from sys import stdin
-import re
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.parsing import int_array, ints
+from aoc.stream import chunks
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
 
 
-def parse(line: str) -> tuple[complex, complex]:
-    """Parses a line of input into a tuple of two complex numbers, the robot's
-    current position and velocity.
+def parse(input_string: str | bytes) -> list[tuple[complex, complex]]:
+    """Parses the input into a list of robots, each a tuple of two complex
+    numbers: the robot's current position and velocity.
     """
-    match = re.search(r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)", line)
-    if match is None:
+    values = ints(input_string)
+    if len(values) % 4 != 0:
         raise ValueError("Invalid input string")
-    p = complex(int(match.group(1)), int(match.group(2)))
-    v = complex(int(match.group(3)), int(match.group(4)))
-    return p, v
+    return [(complex(px, py), complex(vx, vy))
+            for px, py, vx, vy in zip(*[iter(values)] * 4)]
 
 
 def move(robot: tuple[complex, complex],
@@ -48,7 +62,7 @@ def tests():
     p=2,4 v=2,-3
     p=9,5 v=-3,-3"""
     width, height = 11, 7
-    robots = [parse(line) for line in input_string.splitlines()]
+    robots = parse(input_string)
     for _ in range(100):
         robots = [move(robot, width, height) for robot in robots]
 
@@ -65,13 +79,16 @@ def tests():
     assert q3 == 4
     assert q4 == 1
 
+    stream = io.BytesIO(input_string.encode())
+    assert main_stream(stream, width, height) == 12
+
 
 def main(input_string: str) -> int:
     """Calculates the "safety factor" after 100 moves by multiplying the number
     of robots in each quadrant.
     """
     width, height = 101, 103
-    robots = [parse(line) for line in input_string.splitlines()]
+    robots = parse(input_string)
     for _ in range(100):
         robots = [move(robot, width, height) for robot in robots]
 
@@ -86,6 +103,29 @@ def main(input_string: str) -> int:
     return q1 * q2 * q3 * q4
 
 
+def main_stream(stream: BinaryIO, width: int = 101, height: int = 103) -> int:
+    """Calculates the same safety factor as main, reading the robots a block
+    at a time. A robot's position after 100 moves is just p + 100 * v wrapped
+    to the room, so each robot is counted and dropped as soon as it's read.
+    """
+    x = width // 2
+    y = height // 2
+    quadrants = np.zeros(4, dtype=np.int64)
+    for block in chunks(stream):
+        px, py, vx, vy = int_array(block).reshape(-1, 4).T
+        px = (px + 100 * vx) % width
+        py = (py + 100 * vy) % height
+        # Robots on the middle lines don't count
+        counted = (px != x) & (py != y)
+        quadrants += np.bincount(2 * (py[counted] > y) + (px[counted] > x),
+                                 minlength=4)
+    return int(quadrants.prod())
+
+
 if __name__ == '__main__':
-    tests()
-    print(main(stdin.read()))
+    if '--test' in sys.argv[1:]:
+        tests()
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    else:
+        print(main(stdin.read()))
@@ -16,10 +16,25 @@ def print_robots(robots: list[tuple[complex, complex]],
     return grid
 
 
+def find_tree(input_string: str) -> int:
+    """Returns the first second at which the robots line up the way main looks
+    for, or -1 if they never do. Positions repeat after width * height seconds,
+    so there is no point looking any further than that.
+    """
+    width, height = 101, 103
+    robots = parse(input_string)
+    for i in range(width * height):
+        grid = print_robots(robots, width, height)
+        if any(row.count('██') > 20 for row in grid):
+            return i
+        robots = [move(robot, width, height) for robot in robots]
+    return -1
+
+
 def main(input_string: str):
     """Prints the robots to the screen."""
     width, height = 101, 103
-    robots = [parse(line) for line in input_string.splitlines()]
+    robots = parse(input_string)
     i = 0
     while True:
         grid = print_robots(robots, width, height)
@@ -5,32 +5,50 @@ it will push boxes into new positions unless it is blocked by a wall, in which
 case it will not move.
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.grid import find_cell, parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
+
+WALL = ord('#')
+EMPTY = ord('.')
+BOX = ord('O')
+ROBOT = ord('@')
 
 
 class Warehouse:
     """Class for the warehouse."""
     def __init__(self, input_string: str):
-        self.wh = np.array([list(line) for line in input_string.splitlines()])
-        self.robot = tuple(x[0] for x in np.where(self.wh == '@'))
+        self.wh = parse_grid(input_string).copy()
+        self.robot: tuple[int, ...] = find_cell(self.wh, '@')
 
     def move(self, coord: tuple[int, ...], direction: str) -> tuple[int, ...]:
         """Moves a cell in a given direction if the cell is not blocked."""
         offsets = {'>': (0, 1), '^': (-1, 0), '<': (0, -1), 'v': (1, 0)}
         offset = offsets[direction]
 
-        if self.wh[coord] == '.':
+        if self.wh[coord] == EMPTY:
             return coord
-        if self.wh[coord] == '#':
+        if self.wh[coord] == WALL:
             return tuple(x - y for x, y in zip(coord, offset))
         new_coord = self.move(tuple(x + y for x, y in zip(coord, offset)),
                               direction)
         if new_coord != coord:
-            if self.wh[coord] == '@':
+            if self.wh[coord] == ROBOT:
                 self.robot = new_coord
             self.wh[new_coord] = self.wh[coord]
-            self.wh[coord] = '.'
+            self.wh[coord] = EMPTY
             return coord
         return tuple(x - y for x, y in zip(coord, offset))
 
@@ -38,11 +56,8 @@ class Warehouse:
         """Calculates the GPS coordinates of all boxes in the warehouse, where
         a GPS coordinate is equal to 100 * y + x.
         """
-        gps = 0
-        for (y, x), value in np.ndenumerate(self.wh):
-            if value == 'O':
-                gps += 100 * y + x
-        return gps
+        y, x = np.nonzero(self.wh == BOX)
+        return int((100 * y + x).sum())
 
 
 def tests():
@@ -108,5 +123,6 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
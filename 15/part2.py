@@ -6,15 +6,34 @@ case it will not move. In this part, boxes are now two cells wide and
 represented by '[]'.
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.grid import find_cell, parse_grid
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import('numpy')
+
+WALL = ord('#')
+EMPTY = ord('.')
+ROBOT = ord('@')
+BOX_LEFT = ord('[')
+BOX_RIGHT = ord(']')
 
 
 class Warehouse:
     """Class for the warehouse."""
     def __init__(self, input_string: str):
-        self.wh = np.array([list(line) for line in input_string.splitlines()])
-        self.robot = tuple(x[0] for x in np.where(self.wh == '@'))
+        self.wh = parse_grid(input_string).copy()
+        self.robot: tuple[int, ...] = find_cell(self.wh, '@')
         self.queue: list[tuple[tuple[int, ...], tuple[int, ...]]] = []
 
     def move(self, coord: tuple[int, ...], direction: str, i: int = 0):
@@ -23,14 +42,14 @@ class Warehouse:
         offset = offsets[direction]
         to_coord = tuple(x + y for x, y in zip(coord, offset))
 
-        if self.wh[coord] == '.':
+        if self.wh[coord] == EMPTY:
             return
-        if self.wh[coord] == '#':
+        if self.wh[coord] == WALL:
             self.queue.insert(i, (coord, coord))
             return
-        if self.wh[coord] in '[]' and direction in '^v':
-            box_offsets = {'[': (0, 1), ']': (0, -1)}
-            box_offset = box_offsets[self.wh[coord]]
+        if self.wh[coord] in (BOX_LEFT, BOX_RIGHT) and direction in '^v':
+            box_offsets = {BOX_LEFT: (0, 1), BOX_RIGHT: (0, -1)}
+            box_offset = box_offsets[int(self.wh[coord])]
             pair = tuple(x + y for x, y in zip(coord, box_offset))
             to_coord2 = tuple(x + y for x, y in zip(pair, offset))
             # Checks have to be inserted in a breadth-first manner, so that
@@ -44,17 +63,17 @@ class Warehouse:
         self.queue.insert(i, (coord, to_coord))
         pos = len(self.queue)
         self.move(to_coord, direction, pos)
-        if self.wh[coord] == '@':
+        if self.wh[coord] == ROBOT:
             if any(x == y for x, y in self.queue):
                 self.queue = []
                 return
             self.queue = list(dict.fromkeys(self.queue))
             for q, new_q in self.queue[::-1]:
                 self.wh[new_q] = self.wh[q]
-                self.wh[q] = '.'
+                self.wh[q] = EMPTY
             self.robot = to_coord
-            self.wh[to_coord] = '@'
-            self.wh[coord] = '.'
+            self.wh[to_coord] = ROBOT
+            self.wh[coord] = EMPTY
             self.queue = []
             return
         return
@@ -63,14 +82,11 @@ class Warehouse:
         """Calculates the GPS coordinates of all boxes in the warehouse, where
         a GPS coordinate is equal to 100 * y + x.
         """
-        gps = 0
-        for (y, x), value in np.ndenumerate(self.wh):
-            if value == '[':
-                gps += 100 * y + x
-        return gps
+        y, x = np.nonzero(self.wh == BOX_LEFT)
+        return int((100 * y + x).sum())
 
     def __str__(self):
-        return '\n'.join(''.join(line) for line in self.wh)
+        return '\n'.join(line.tobytes().decode() for line in self.wh)
 
 
 def widen_warehouse(input_string: str) -> str:
@@ -132,5 +148,6 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
@@ -3,65 +3,72 @@
 Implements Dijkstra's algortihm to find the most cost-effective path.
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
+from pathlib import Path
 from heapq import heappush, heappop
-import numpy as np
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
+from aoc.grid import find_cell, parse_grid, steps
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+WALL = ord('#')
 
 
-def parse(input_string: str) -> tuple[NDArray[np.str_],
+def parse(input_string: str) -> tuple[NDArray[np.uint8],
                                       tuple[int, int],
                                       tuple[int, int]]:
     """Parses the input string into a maze and its start and end coordinates.
     """
-    maze = np.array([list(line) for line in input_string.splitlines()])
-    start, end = (0, 0), (0, 0)
-    for r, row in enumerate(maze):
-        for c, cell in enumerate(row):
-            if cell == 'S':
-                start = (r, c)
-            elif cell == 'E':
-                end = (r, c)
-    return maze, start, end
-
-
-def dijkstra(maze: NDArray[np.str_],
+    maze = parse_grid(input_string)
+    return maze, find_cell(maze, 'S'), find_cell(maze, 'E')
+
+
+def dijkstra(maze: NDArray[np.uint8],
              start: tuple[int, int],
              end: tuple[int, int]) -> int:
     """Finds the most cost-effective path in the maze and returns that cost."""
-    height, width = maze.shape
-    # Queue contains cost, position, and offset (i.e. direction)
-    queue: list[tuple[int, tuple[int, int], tuple[int, int]]] = []
-    visited = set()
-
-    # Initial position and direction:
-    heappush(queue, (0, start, (0, 1)))
+    width = maze.shape[1]
+    # The cell one step ahead of each cell, for each of the four directions
+    # (east, south, west, north), or -1 if that's a wall
+    with instrument.span('step table'):
+        ahead = steps(maze.shape, maze != WALL).tolist()
+    # Counted stand-ins for the heap functions when instrumented
+    push, pop = heappush, heappop
+    if instrument.enabled:
+        push = instrument.counted(heappush, 'heap pushes')
+        pop = instrument.counted(heappop, 'heap pops')
+    end_cell = end[0] * width + end[1]
+    # Queue contains cost, cell, and direction
+    queue: list[tuple[int, int, int]] = []
+    visited = bytearray(4 * maze.size)
+
+    # Initial position and direction (east):
+    push(queue, (0, start[0] * width + start[1], 0))
 
     while queue:
-        cost, coord, offset = heappop(queue)
+        cost, cell, direction = pop(queue)
 
-        if coord == end:
+        if cell == end_cell:
             return cost
 
-        if (coord, offset) in visited:
+        if visited[4 * cell + direction]:
             continue
-        visited.add((coord, offset))
-
-        # For any offset (x, y), 90 degree turns are (y, -x) and (-y, x)
-        for new_offset in [offset,
-                           (offset[1], -offset[0]),
-                           (-offset[1], offset[0])]:
-            if new_offset == offset:
-                new_coord = (coord[0] + offset[0], coord[1] + offset[1])
-                new_cost = cost + 1
-            else:
-                new_coord = coord
-                new_cost = cost + 1000
-
-            if (0 <= new_coord[0] < height and
-                    0 <= new_coord[1] < width and
-                    maze[new_coord] != '#'):
-                heappush(queue, (new_cost, new_coord, new_offset))
+        visited[4 * cell + direction] = 1
+
+        new_cell = ahead[direction][cell]
+        if new_cell >= 0:
+            push(queue, (cost + 1, new_cell, direction))
+        # 90 degree turns
+        push(queue, (cost + 1000, cell, (direction + 1) % 4))
+        push(queue, (cost + 1000, cell, (direction - 1) % 4))
     return 0
 
 
@@ -117,5 +124,6 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
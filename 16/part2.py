@@ -7,67 +7,86 @@ Much credit to HyperNeutrino (https://www.youtube.com/watch?v=BJhpteqlVPM) for
 showing how to adapt the original Dijkstra's algorithm to count all cells.
 """
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
+from pathlib import Path
 from collections import deque
 from heapq import heappush, heappop
-import numpy as np
-from numpy.typing import NDArray
-from part1 import parse
+from typing import TYPE_CHECKING
+from part1 import WALL, parse
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
+from aoc.grid import steps
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
-def dijkstra(maze: NDArray[np.str_],
+def dijkstra(maze: NDArray[np.uint8],
              start: tuple[int, int],
              end: tuple[int, int]) -> int:
     """Finds the most cost-effective path in the maze and returns that cost."""
-    height, width = maze.shape
-    # Queue contains cost, position, and offset (i.e. direction)
-    queue: list[tuple[float, tuple[int, int], tuple[int, int]]] = []
+    width = maze.shape[1]
+    # The cell one step ahead of each cell, for each of the four directions
+    # (east, south, west, north), or -1 if that's a wall
+    with instrument.span('step table'):
+        ahead = steps(maze.shape, maze != WALL).tolist()
+    # Counted stand-ins for the heap functions when instrumented
+    push, pop = heappush, heappop
+    if instrument.enabled:
+        push = instrument.counted(heappush, 'heap pushes')
+        pop = instrument.counted(heappop, 'heap pops')
+    end_cell = end[0] * width + end[1]
+    # A state is a cell and a direction, numbered 4 * cell + direction
+    start_state = 4 * (start[0] * width + start[1])    # Facing east
+    # Queue contains cost and state
+    queue: list[tuple[float, int]] = []
     best_cost = float('inf')
-    # Keep track of the lowest cost to get to each position
-    lowest_cost = {(start, (0, 1)): 0.0}
+    # Keep track of the lowest cost to get to each state
+    lowest_cost = {start_state: 0.0}
     # Backtrack map
-    backtrack: dict[tuple[tuple[int, int], tuple[int, int]],
-                    set[tuple[tuple[int, int], tuple[int, int]]]] = {}
+    backtrack: dict[int, set[int]] = {}
     end_states = set()
 
     # Initial position and direction:
-    heappush(queue, (0.0, start, (0, 1)))
+    push(queue, (0.0, start_state))
 
     while queue:
-        cost, coord, offset = heappop(queue)
+        cost, state = pop(queue)
 
-        if cost > lowest_cost.get((coord, offset), float('inf')):
+        if cost > lowest_cost.get(state, float('inf')):
             continue
 
-        if coord == end:
+        cell, direction = divmod(state, 4)
+        if cell == end_cell:
             if cost > best_cost:
                 break
             best_cost = cost
-            end_states.add((coord, offset))
-
-        # For any offset (x, y), 90 degree turns are (y, -x) and (-y, x)
-        for new_offset in [offset,
-                           (offset[1], -offset[0]),
-                           (-offset[1], offset[0])]:
-            if new_offset == offset:
-                new_coord = (coord[0] + offset[0], coord[1] + offset[1])
-                new_cost = cost + 1
-            else:
-                new_coord = coord
-                new_cost = cost + 1000
-
-            if (0 <= new_coord[0] < height and
-                    0 <= new_coord[1] < width and
-                    maze[new_coord] != '#'):
-                l_cost = lowest_cost.get((new_coord, new_offset), float('inf'))
-                if new_cost > l_cost:
-                    continue
-                if new_cost < l_cost:
-                    backtrack[(new_coord, new_offset)] = set()
-                    lowest_cost[(new_coord, new_offset)] = new_cost
-                backtrack[(new_coord, new_offset)].add((coord, offset))
-                heappush(queue, (new_cost, new_coord, new_offset))
-
+            end_states.add(state)
+
+        # Forwards, then the two 90 degree turns
+        moves = [(cost + 1000, 4 * cell + (direction + 1) % 4),
+                 (cost + 1000, 4 * cell + (direction - 1) % 4)]
+        new_cell = ahead[direction][cell]
+        if new_cell >= 0:
+            moves.insert(0, (cost + 1, 4 * new_cell + direction))
+
+        for new_cost, new_state in moves:
+            l_cost = lowest_cost.get(new_state, float('inf'))
+            if new_cost > l_cost:
+                continue
+            if new_cost < l_cost:
+                backtrack[new_state] = set()
+                lowest_cost[new_state] = new_cost
+            backtrack[new_state].add(state)
+            push(queue, (new_cost, new_state))
+
+    if instrument.enabled:
+        instrument.count('states reached', len(lowest_cost))
     states = deque(end_states)
     seen = set(end_states)
 
@@ -79,8 +98,7 @@ def dijkstra(maze: NDArray[np.str_],
             seen.add(last)
             states.append(last)
 
-    return len({x for x, _ in seen})
-
+    return len({x // 4 for x in seen})
 
 
 def tests():
@@ -135,5 +153,6 @@ def main(input_string: str) -> int:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in sys.argv[1:]:
+        tests()
     print(main(stdin.read()))
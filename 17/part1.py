@@ -1,6 +1,6 @@
 """Day 17: Chronospatial Computer"""
 
-from sys import stdin
+from sys import argv, stdin
 
 
 class Computer:
@@ -57,27 +57,20 @@ class Computer:
         """Sets register B to A / 2^combo(op)."""
         self.regC = self.dv(op)
 
+    # The instruction for each opcode, built once for every Computer
+    OPCODES = [adv, bxl, bst, jnz, bxc, out, bdv, cdv]
+
     def run(self):
         """Runs the program until the instruction pointer is past the end of
         the program.
         """
-        opcodes = {
-            0: self.adv,
-            1: self.bxl,
-            2: self.bst,
-            3: self.jnz,
-            4: self.bxc,
-            5: self.out,
-            6: self.bdv,
-            7: self.cdv
-        }
-
+        opcodes = self.OPCODES
         end = len(self.program)
 
         while self.instruction < end:
             opcode = self.program[self.instruction]
             op = self.program[self.instruction + 1]
-            opcodes[opcode](op)
+            opcodes[opcode](self, op)
             if opcode != 3:
                 self.instruction += 2
 
@@ -123,5 +116,6 @@ def main(input_string: str) -> list[int]:
 
 
 if __name__ == '__main__':
-    tests()
+    if '--test' in argv[1:]:
+        tests()
     print(','.join([str(x) for x in main(stdin.read())]))
@@ -23,22 +23,58 @@ B bits:  0. 000 001 010 011 100 101 110 111
         10. 101 100 101 111 001 000 011 010
         12. // We now know that the bits in A must be 101.
 
-For each iteration in the loop, we will try all 8 possibilities.
+For each iteration in the loop, we will try all 8 possibilities. Rather than
+hard-coding the operations above, each candidate is run through the Part 1
+Computer, which works for any program with this shape (and keeps every
+candidate in case more than one set of bits fits).
 """
 
-sequence = [0, 3, 5, 5, 7, 1, 3, 0, 5, 4, 5, 7, 2, 1, 4, 2]
-
-A = 0
-for n in sequence:
-    for bits in range(0, 8):
-        A_temp = (A << 3) + bits
-        B = A_temp & 7
-        B = B ^ 2
-        C = A_temp >> B
-        B = B ^ C
-        B = B ^ 7
-        if B & 7 == n:
-            A = A_temp
-            break
-
-print(A)
+from sys import argv, stdin
+from part1 import Computer
+
+
+def parse(input_string: str) -> list[int]:
+    """Parses the program from the last line of the input."""
+    lines = input_string.splitlines()
+    return [int(x) for x in lines[4].split()[-1].split(',')]
+
+
+def find_register(program: list[int]) -> int:
+    """Finds the lowest value of register A for which the program outputs a
+    copy of itself. A is built three bits at a time, matching the output from
+    the last value backwards.
+    """
+    candidates = [0]
+    for n in range(1, len(program) + 1):
+        expected = program[-n:]
+        new_candidates = []
+        for a in candidates:
+            for bits in range(0, 8):
+                c = Computer((a << 3) + bits, 0, 0, program)
+                c.run()
+                if c.output == expected:
+                    new_candidates.append((a << 3) + bits)
+        candidates = new_candidates
+    return min(candidates)
+
+
+def tests():
+    """Tests for this module."""
+    program = [0, 3, 5, 4, 3, 0]
+    assert find_register(program) == 117440
+
+    program = [2, 4, 1, 2, 7, 5, 4, 5, 0, 3, 1, 7, 5, 5, 3, 0]
+    c = Computer(find_register(program), 0, 0, program)
+    c.run()
+    assert c.output == program
+
+
+def main(input_string: str) -> int:
+    """Finds the value of register A that makes the program print itself."""
+    return find_register(parse(input_string))
+
+
+if __name__ == '__main__':
+    if '--test' in argv[1:]:
+        tests()
+    print(main(stdin.read()))
@@ -1,18 +1,31 @@
 """Day 18: RAM Run, Part 1"""
 
+from __future__ import annotations
+
+import sys
 from sys import stdin
+from pathlib import Path
 from heapq import heappush, heappop
-import numpy as np
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING, BinaryIO
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc import instrument
+from aoc.grid import adjacency
+from aoc.parsing import ints
+from aoc.stream import chunks
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import('numpy')
 
 
-def parse(input_string: str) -> list[tuple[int, int]]:
+def parse(input_string: str | bytes) -> list[tuple[int, int]]:
     """Parses a string of comma-separate integers into tuples."""
-    blocks = []
-    for line in input_string.splitlines():
-        nums = [int(x) for x in line.split(',')]
-        blocks.append((nums[0], nums[1]))
-    return blocks
+    values = ints(input_string)
+    return list(zip(values[0::2], values[1::2]))
 
 
 def create_maze(size: int, blocks: list[tuple[int, int]]) -> NDArray[np.bool_]:
@@ -29,29 +42,35 @@ def dijkstra(maze: NDArray[np.bool_],
              start: tuple[int, int],
              end: tuple[int, int]) -> int:
     """Finds the shortest path through the maze and returns the length."""
-    queue: list[tuple[int, tuple[int, int]]] = []
-    visited = set()
+    width = maze.shape[1]
+    # Open neighbours of each open cell, numbered row * width + column
+    with instrument.span('adjacency'):
+        starts, targets = adjacency(maze, passable=maze)
+        starts, targets = starts.tolist(), targets.tolist()
+    # Counted stand-ins for the heap functions when instrumented
+    push, pop = heappush, heappop
+    if instrument.enabled:
+        push = instrument.counted(heappush, 'heap pushes')
+        pop = instrument.counted(heappop, 'heap pops')
+    end_cell = end[0] * width + end[1]
+    queue: list[tuple[int, int]] = []
+    visited = bytearray(maze.size)
 
     # Initial position
-    heappush(queue, (0, start))
+    push(queue, (0, start[0] * width + start[1]))
 
     while queue:
-        cost, coord = heappop(queue)
+        cost, cell = pop(queue)
 
-        if coord == end:
+        if cell == end_cell:
             return cost
 
-        if coord in visited:
+        if visited[cell]:
             continue
-        visited.add(coord)
+        visited[cell] = 1
 
-        for offset in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-            new_coord = (coord[0] + offset[0], coord[1] + offset[1])
-
-            if (0 <= new_coord[0] < maze.shape[0] and
-                    0 <= new_coord[1] < maze.shape[1] and
-                    maze[new_coord]):
-                heappush(queue, (cost + 1, new_coord))
+        for new_cell in targets[starts[cell]:starts[cell + 1]]:
+            push(queue, (cost + 1, new_cell))
     return 0
 
 
@@ -91,6 +110,22 @@ def main(input_string: str) -> int:
     return dijkstra(maze, (0, 0), (70, 70))  # Nice
 
 
+def main_stream(stream: BinaryIO) -> int:
+    """Finds the length of the optimal path through the maze, reading blocks
+    only until the first 1024 are in."""
+    blocks: list[tuple[int, int]] = []
+    for chunk in chunks(stream):
+        blocks += parse(chunk)
+        if len(blocks) >= 1024:
+            break
+    maze = create_maze(71, blocks[:1024])
+    return dijkstra(maze, (0, 0), (70, 70))
+
+
 if __name__ == '__main__':
-    tests()
-    print(main(stdin.read()))
+    if '--test' in sys.argv[1:]:
+        tests()
+    if '--stream' in sys.argv[1:]:
+        print(main_stream(sys.stdin.buffer))
+    else:
+        print(main(stdin.read()))
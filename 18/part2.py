@@ -1,8 +1,14 @@
 """Day 18: RAM Run, Part 2"""
 
+import sys
 from sys import stdin
+from pathlib import Path
+from typing import BinaryIO
 import part1
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoc.stream import chunks
+
 
 def find_blockage(size: int, blocks: list[tuple[int, int]]) -> tuple[int, int]:
     """Finds the first block that will make it impossible to navigate the maze
@@ -92,7 +98,23 @@ def main(input_string: str) -> tuple[int, int]:
     return find_blockage(71, blocks)
 
 
+def main_stream(stream: BinaryIO) -> tuple[int, int]:
+    """Finds the block that prevents passage in the maze, reading blocks only
+    until the path is cut off."""
+    blocks: list[tuple[int, int]] = []
+    for chunk in chunks(stream):
+        blocks += part1.parse(chunk)
+        maze = part1.create_maze(71, blocks)
+        if part1.dijkstra(maze, (0, 0), (70, 70)) == 0:
+            break
+    return find_blockage(71, blocks)
+
+
 if __name__ == '__main__':
-    tests()
-    block = main(stdin.read())
+    if '--test' in sys.argv[1:]:
+        tests()
+    if '--stream' in sys.argv[1:]:
+        block = main_stream(sys.stdin.buffer)
+    else:
+        block = main(stdin.read())
     print(f"{block[0]},{block[1]}")
@@ -0,0 +1,5 @@
+"""Shared tooling for running and measuring the daily solutions.
+
+Each NN/partN.py is still a standalone script; nothing in here is needed to
+run one. Run the tools from the repository root, e.g. python -m aoc.runner.
+"""
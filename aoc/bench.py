@@ -0,0 +1,219 @@
+"""Benchmarks every solver against generated inputs at increasing scales.
+
+Each (solver, scale) is measured in a fresh process, so peak RSS belongs to
+that solver alone. The time per run is the runner's parse + solve time. Once
+a solver times out, its larger scales are skipped.
+
+    python -m aoc.bench run -s 1 10 100 -o results.json
+    python -m aoc.bench run 1 16.2 -s 1 10 --repeat 3 -o day1.json
+    python -m aoc.bench compare baseline.json results.json --threshold 10
+
+The run results hold the median and p95 time and peak RSS at each scale, plus
+an empirical complexity for each solver: the slope of log(time) against
+log(input size). A solver whose slope is well above 1 (e.g. day 5, which
+checks every rule against every update) is flagged as superlinear. Compare
+exits with status 1 if any solver's median got slower than the baseline by
+more than the threshold.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+from aoc import generators, runner
+
+SUPERLINEAR = 1.2
+
+
+def _measure(day: int, part: int, path: str, repeat: int, budget: float,
+             connection: Any):
+    """Runs in the child process: times repeated runs and sends back the
+    answer, times, and peak RSS."""
+    try:
+        solver = runner.SOLVERS[(day, part)]
+        data = Path(path).read_text()
+        times = []
+        for _ in range(repeat):
+            result = runner.run(solver, data, path)
+            times.append(result.total_time)
+            if result.total_time > budget:
+                break
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        connection.send({'answer': result.answer, 'times': times,
+                         'peak_rss_kb': rss})
+    except Exception as e:  # pylint: disable=broad-except
+        connection.send({'error': f'{type(e).__name__}: {e}'})
+    finally:
+        connection.close()
+
+
+def measure(solver: runner.Solver, path: Path, repeat: int, budget: float,
+            timeout: float) -> dict[str, Any]:
+    """Measures one solver on one input in a fresh process."""
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure,
+                              args=(solver.day, solver.part, str(path),
+                                    repeat, budget, sender))
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            measurement = receiver.recv()
+        else:
+            measurement = {'error': f'timed out after {timeout:g} s'}
+    except EOFError:
+        measurement = {'error': f'exited with code {process.exitcode}'}
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        receiver.close()
+
+    if 'times' in measurement:
+        times = sorted(measurement['times'])
+        measurement['median'] = statistics.median(times)
+        measurement['p95'] = (statistics.quantiles(times, n=20,
+                                                   method='inclusive')[-1]
+                              if len(times) > 1 else times[0])
+    return measurement
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float | None:
+    """Fits time ~ size^k by least squares on a log-log scale and returns k.
+
+    >>> round(fit_exponent([(1000, 0.01), (10000, 0.1), (100000, 1.0)]), 2)
+    1.0
+    >>> round(fit_exponent([(1000, 0.01), (10000, 1.0)]), 2)
+    2.0
+    """
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    return sum((x - x_mean) * (y - y_mean)
+               for x, y in zip(xs, ys)) / variance
+
+
+def key(day: int, part: int) -> str:
+    """The name used for a solver in the results file."""
+    return f'{day:02}.{part}'
+
+
+def run(args: argparse.Namespace) -> int:
+    """Benchmarks the selected solvers and writes the results."""
+    results = []
+    fits = {}
+    for solver in runner.select(args.selectors):
+        points = []
+        for scale in sorted(args.scale):
+            # Inputs from different seeds are different inputs, so each
+            # seed gets its own directory: DIR/seedN/NN/xSCALE.txt
+            path = generators.input_path(args.inputs / f'seed{args.seed}',
+                                         solver.day, scale)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(generators.generate(solver.day, scale,
+                                                    args.seed))
+            measurement = measure(solver, path, args.repeat, args.budget,
+                                  args.timeout)
+            entry = {'day': solver.day, 'part': solver.part, 'scale': scale,
+                     'bytes': path.stat().st_size, **measurement}
+            results.append(entry)
+            name = key(solver.day, solver.part)
+            if 'error' in measurement:
+                print(f'{name} x{scale:<6g} {measurement["error"]}',
+                      flush=True)
+                break
+            print(f'{name} x{scale:<6g} median {entry["median"]:10.4f} s'
+                  f'  p95 {entry["p95"]:10.4f} s'
+                  f'  rss {entry["peak_rss_kb"] / 1024:8.1f} MB', flush=True)
+            points.append((entry['bytes'], entry['median']))
+
+        exponent = fit_exponent(points)
+        if exponent is not None:
+            name = key(solver.day, solver.part)
+            fits[name] = {'exponent': round(exponent, 3),
+                          'superlinear': exponent > SUPERLINEAR}
+            flag = '  superlinear' if exponent > SUPERLINEAR else ''
+            print(f'{name} grows like n^{exponent:.2f}{flag}', flush=True)
+
+    output = {'python': platform.python_version(), 'seed': args.seed,
+              'repeat': args.repeat, 'results': results, 'fits': fits}
+    if args.output:
+        args.output.write_text(json.dumps(output, indent=2) + '\n')
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compares two results files and fails on any regression past the
+    threshold."""
+    def medians(path: Path) -> dict[tuple[str, float], float]:
+        data = json.loads(path.read_text())
+        return {(key(x['day'], x['part']), x['scale']): x['median']
+                for x in data['results'] if 'median' in x}
+
+    baseline, current = medians(args.baseline), medians(args.current)
+    limit = 1 + args.threshold / 100
+    regressions = 0
+    for name, scale in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[(name, scale)], current[(name, scale)]
+        if before < args.min_time:
+            continue
+        change = (after / before - 1) * 100
+        status = 'REGRESSION' if after > before * limit else ''
+        regressions += bool(status)
+        print(f'{name} x{scale:<6g} {before:10.4f} s -> {after:10.4f} s'
+              f'  {change:+7.1f}%  {status}')
+    print(f'{regressions} regression(s) over {args.threshold:g}%')
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('selectors', nargs='*', metavar='DAY[.PART]')
+    run_parser.add_argument('-s', '--scale', type=float, nargs='+',
+                            default=[1, 10, 100])
+    run_parser.add_argument('-r', '--repeat', type=int, default=5)
+    run_parser.add_argument('--seed', type=int, default=2024)
+    run_parser.add_argument('--budget', type=float, default=10,
+                            help='stop repeating once a run takes this long')
+    run_parser.add_argument('--timeout', type=float, default=120,
+                            help='give up on a scale after this many seconds')
+    run_parser.add_argument('-i', '--inputs', type=Path,
+                            default=Path('bench_inputs'),
+                            help='where generated inputs are cached, as '
+                            'DIR/seedN/NN/xSCALE.txt')
+    run_parser.add_argument('-o', '--output', type=Path)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser('compare', help='compare two runs')
+    compare_parser.add_argument('baseline', type=Path)
+    compare_parser.add_argument('current', type=Path)
+    compare_parser.add_argument('-t', '--threshold', type=float, default=10,
+                                help='allowed slowdown in percent')
+    compare_parser.add_argument('--min-time', type=float, default=0.001,
+                                help='ignore baselines faster than this')
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
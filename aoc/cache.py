@@ -0,0 +1,178 @@
+"""A content-addressed cache of solver answers on disk.
+
+Answers are keyed by the day and part, the SHA-256 of the input bytes, and
+a hash of the solver's source: every .py file in the day's directory plus the
+aoc modules they import. Editing e.g. 16/part2.py changes the key, so stale
+answers are never returned; they just age out. Each answer is a small file
+named by its key, and reading one touches its mtime, so once the directory
+grows past its size limit the least recently used answers are deleted first.
+The limit is on disk usage (allocated blocks), not st_size: an answer of a
+few bytes still takes a block. Each Cache keeps a running total rather than
+rescanning the directory on every put, and when it passes the limit evicts
+down to a low-water mark, so a full cache is only rescanned now and then.
+
+Nothing here imports the solvers (or NumPy), so a warm run of the runner
+costs little more than hashing the input:
+
+    python -m aoc.runner --cache 16
+    python -m aoc.cache             # show what's cached
+    python -m aoc.cache --clear
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DIR = ROOT / '.cache'
+MAX_BYTES = 16 << 20
+LOW_WATER = 0.75  # of max_bytes, what evict() trims the cache down to
+
+# from aoc.grid import ... or from aoc import instrument
+_AOC_IMPORT = re.compile(rb'^\s*from\s+aoc(?:\.(\w+)\s+|\s+import\s+(\w+))',
+                         re.MULTILINE)
+
+
+def source_hash(day: int) -> str:
+    """Hashes the source files a day's solutions are built from: its own
+    modules and the aoc modules they (and those in turn) import.
+
+    >>> source_hash(1) == source_hash(1) != source_hash(2)
+    True
+    """
+    paths = sorted((ROOT / f'{day:02}').glob('*.py'))
+    digest = hashlib.sha256()
+    seen = set(paths)
+    for path in paths:
+        text = path.read_bytes()
+        digest.update(path.relative_to(ROOT).as_posix().encode() + b'\0')
+        digest.update(hashlib.sha256(text).digest())
+        for dotted, imported in _AOC_IMPORT.findall(text):
+            module = (dotted or imported).decode()
+            dependency = ROOT / 'aoc' / f'{module}.py'
+            if dependency not in seen:
+                seen.add(dependency)
+                paths.append(dependency)
+    return digest.hexdigest()
+
+
+def _usage(stat: os.stat_result) -> int:
+    """Returns the bytes a file takes on disk."""
+    return stat.st_blocks * 512
+
+
+class Cache:
+    """A directory of answers, taking at most about max_bytes of disk.
+
+    >>> import shutil, tempfile
+    >>> cache = Cache(Path(tempfile.mkdtemp()))
+    >>> cache.put('first', '1')
+    >>> cache.max_bytes = 4 * cache.size
+    >>> for i in range(10):
+    ...     cache.put(str(i), str(i))
+    >>> len(cache.entries()) <= 4, cache.get('9')
+    (True, '9')
+    >>> shutil.rmtree(cache.directory)
+    """
+    def __init__(self, directory: Path = DEFAULT_DIR,
+                 max_bytes: int = MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.sources: dict[int, str] = {}
+        # Disk used by the answers, counted on the first put. Only this
+        # process's puts are added, so it drifts if others share the
+        # directory; each evict() recounts it.
+        self.size: int | None = None
+
+    def key(self, day: int, part: int, data: bytes, *variant: str) -> str:
+        """Returns the key for a day and part on an input. Anything else that
+        changes the answer (e.g. the solver's arguments) goes in variant."""
+        if day not in self.sources:
+            self.sources[day] = source_hash(day)
+        digest = hashlib.sha256(f'{day}.{part}'.encode())
+        for item in (hashlib.sha256(data).hexdigest(), self.sources[day],
+                     *variant):
+            digest.update(b'\0' + item.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Returns the answer stored under key, or None."""
+        path = self.directory / key
+        try:
+            answer = path.read_text()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return answer
+
+    def put(self, key: str, answer: str):
+        """Stores an answer, then evicts old answers if over the limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.size is None:
+            self.size = sum(_usage(stat) for stat, _ in self.entries())
+        path = self.directory / key
+        # Write then rename, so a concurrent reader never sees half an answer
+        with tempfile.NamedTemporaryFile('w', dir=self.directory,
+                                         delete=False) as file:
+            file.write(answer)
+        try:
+            self.size -= _usage(path.stat())
+        except FileNotFoundError:
+            pass
+        os.replace(file.name, path)
+        self.size += _usage(path.stat())
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self) -> list[tuple[os.stat_result, Path]]:
+        """Returns (stat, path) for every answer, least recently used first.
+        """
+        entries = []
+        for path in self.directory.glob('*'):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                continue
+        return sorted(entries, key=lambda x: x[0].st_mtime)
+
+    def evict(self):
+        """Deletes the least recently used answers until the cache is down to
+        its low-water mark."""
+        entries = self.entries()
+        self.size = sum(_usage(stat) for stat, _ in entries)
+        for stat, path in entries:
+            if self.size <= self.max_bytes * LOW_WATER:
+                break
+            path.unlink(missing_ok=True)
+            self.size -= _usage(stat)
+
+    def clear(self):
+        """Deletes every answer."""
+        for _, path in self.entries():
+            path.unlink(missing_ok=True)
+        self.size = 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-d', '--directory', type=Path, default=DEFAULT_DIR)
+    parser.add_argument('--clear', action='store_true',
+                        help='delete every cached answer')
+    args = parser.parse_args(argv)
+
+    cache = Cache(args.directory)
+    if args.clear:
+        cache.clear()
+    entries = cache.entries() if args.directory.is_dir() else []
+    size = sum(_usage(stat) for stat, _ in entries)
+    print(f'{len(entries)} answers, {size} bytes on disk in {args.directory}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
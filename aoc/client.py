@@ -0,0 +1,99 @@
+"""Command line client for the solver daemon (see aoc.daemon).
+
+A drop-in for running a day's script, without paying for interpreter start
+up, imports and NumPy on every call:
+
+    python -m aoc.client 16.2 < input.txt        # like python 16/part2.py
+    python -m aoc.client 16.2 a.txt b.txt --time
+
+The protocol is one JSON header line per request, followed by the input:
+
+    {"id": 0, "day": 16, "part": 2, "length": 20736}\\n<20736 bytes>
+
+and one JSON line per answer, as each one finishes:
+
+    {"id": 0, "answer": "...", "parse_time": ..., "solve_time": ...,
+     "wall_time": ...}
+
+or {"id": 0, "error": "..."} if the solver raised. Several requests can be
+sent down one connection without waiting for the answers.
+
+This module is imported on every call, so it sticks to the few standard
+library modules it needs (not even pathlib).
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+DEFAULT_SOCKET = os.environ.get('AOC_SOCKET', f'/tmp/aoc-{os.getuid()}.sock')
+
+
+def header(request_id: int, day: int, part: int, length: int) -> bytes:
+    """Encodes a request header line."""
+    return json.dumps({'id': request_id, 'day': day, 'part': part,
+                       'length': length}).encode() + b'\n'
+
+
+def solve(day: int, part: int, inputs: list[bytes],
+          path: str = DEFAULT_SOCKET) -> list[dict[str, Any]]:
+    """Sends every input to the daemon over one connection and returns the
+    responses in the same order as the inputs."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        for i, data in enumerate(inputs):
+            connection.sendall(header(i, day, part, len(data)) + data)
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile('rb') as replies:
+            responses = [json.loads(line) for line in replies]
+    # A bad request may come back without an id; put it last
+    return sorted(responses, key=lambda x: (x['id'] is None, x['id'] or 0))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('selector', metavar='DAY.PART')
+    parser.add_argument('files', nargs='*',
+                        help='input files (default: stdin)')
+    parser.add_argument('-s', '--socket', default=DEFAULT_SOCKET)
+    parser.add_argument('-t', '--time', action='store_true',
+                        help='report timings on stderr')
+    args = parser.parse_args(argv)
+
+    day, _, part = args.selector.partition('.')
+    if not (day.isdigit() and part.isdigit()):
+        parser.error('expected a day and part, e.g. 16.2')
+    inputs = []
+    for name in args.files:
+        with open(name, 'rb') as file:
+            inputs.append(file.read())
+    if not args.files:
+        inputs.append(sys.stdin.buffer.read())
+    try:
+        responses = solve(int(day), int(part), inputs, args.socket)
+    except OSError as e:
+        print(f"Can't reach the daemon at {args.socket}: {e}",
+              file=sys.stderr)
+        return 2
+
+    status = 0
+    for response in responses:
+        if 'error' in response:
+            print(response['error'], file=sys.stderr)
+            status = 1
+            continue
+        print(response['answer'])
+        if args.time:
+            print(f"parse {response['parse_time'] * 1000:.2f} ms  "
+                  f"solve {response['solve_time'] * 1000:.2f} ms  "
+                  f"wall {response['wall_time'] * 1000:.2f} ms",
+                  file=sys.stderr)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
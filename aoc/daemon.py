@@ -0,0 +1,151 @@
+"""A long-lived solver daemon on a Unix socket.
+
+Starting Python and importing a day (and NumPy) costs more than solving most
+puzzle-sized inputs. The daemon pays for that once: a pool of worker
+processes imports every NN/partN module up front, and an asyncio server
+accepts requests on a Unix socket and hands each solve to the pool, so the
+event loop only ever reads requests and writes answers. Answers go back as
+each solve finishes, with its parse, solve and wall time.
+
+    python -m aoc.daemon -j 4 &
+    python -m aoc.client 16.2 < input.txt
+
+See aoc.client for the protocol.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from aoc import runner
+from aoc.client import DEFAULT_SOCKET
+
+
+def _warm():
+    """Runs in each worker as it starts: imports every solver."""
+    # Ctrl-C reaches the whole process group; let the server shut us down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for solver in runner.SOLVERS.values():
+        runner.load(solver.day, f'part{solver.part}')
+    # Days bind NumPy lazily, so load it now rather than on a first request
+    import numpy  # pylint: disable=import-outside-toplevel
+    numpy.zeros(0)
+
+
+def _solve(day: int, part: int, data: bytes) -> dict[str, Any]:
+    """Runs in a worker: solves one input."""
+    result = runner.run(runner.SOLVERS[(day, part)], data.decode())
+    return {'answer': result.answer, 'parse_time': result.parse_time,
+            'solve_time': result.solve_time}
+
+
+async def _answer(pool: ProcessPoolExecutor, request: dict[str, Any],
+                  data: bytes, writer: asyncio.StreamWriter):
+    """Solves one request on the pool and writes back the answer."""
+    start = time.perf_counter()
+    try:
+        day, part = request.get('day'), request.get('part')
+        if (day, part) not in runner.SOLVERS:
+            raise ValueError(f'No solver for day {day} part {part}')
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(pool, _solve, day, part, data)
+    except Exception as e:  # pylint: disable=broad-except
+        response = {'error': f'{type(e).__name__}: {e}'}
+    response['id'] = request.get('id')
+    response['wall_time'] = time.perf_counter() - start
+    writer.write(json.dumps(response).encode() + b'\n')
+    await writer.drain()
+
+
+async def handle(pool: ProcessPoolExecutor, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+    """Serves one connection: reads requests until the client stops sending,
+    solving them concurrently, then waits for the last answers."""
+    pending = set()
+    try:
+        while line := await reader.readline():
+            request: Any = None
+            try:
+                request = json.loads(line)
+                length = request['length']
+                if not isinstance(length, int) or length < 0:
+                    raise ValueError('length must be a non-negative integer')
+                data = await reader.readexactly(length)
+            except (ValueError, KeyError, TypeError,
+                    asyncio.IncompleteReadError) as e:
+                # Without a length the rest of the stream can't be framed,
+                # so answer the requests already read, then stop
+                request_id = (request.get('id')
+                              if isinstance(request, dict) else None)
+                error = {'id': request_id, 'error': f'Bad request: {e}'}
+                writer.write(json.dumps(error).encode() + b'\n')
+                break
+            task = asyncio.create_task(_answer(pool, request, data, writer))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        # One failed answer mustn't stop the others being written
+        await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def _remove_stale(path: Path):
+    """Removes a socket left behind by a daemon that didn't shut down, and
+    refuses to start if one is still listening."""
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    raise RuntimeError(f'A daemon is already listening on {path}')
+
+
+async def serve(path: Path, workers: int):
+    """Starts the worker pool and serves requests until interrupted or
+    terminated."""
+    _remove_stale(path)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    with ProcessPoolExecutor(workers, initializer=_warm) as pool:
+        # Start (and warm) every worker now, not on the first requests
+        await asyncio.gather(*(loop.run_in_executor(pool, time.sleep, 0.1)
+                               for _ in range(workers)))
+        server = await asyncio.start_unix_server(partial(handle, pool),
+                                                 path=str(path))
+        print(f'Listening on {path} with {workers} workers', file=sys.stderr)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--socket', type=Path,
+                        default=Path(DEFAULT_SOCKET))
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='worker processes (default: one per CPU)')
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.socket, args.jobs))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
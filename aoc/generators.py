@@ -0,0 +1,385 @@
+"""Synthetic puzzle inputs for every day.
+
+Each generator produces a valid input for its day at a multiple of the real
+puzzle size, e.g. scale=1000 gives a million-row location list for Day 1 or a
+4427x4427 garden for Day 12 (grids grow by area, lists by length). The same
+day, scale and seed always give the same input.
+
+    python -m aoc.generators 12 --scale 100 > garden.txt
+    python -m aoc.generators --out inputs --scale 1 10 100
+"""
+
+import argparse
+import random
+import sys
+from collections import deque
+from math import isqrt
+from pathlib import Path
+from typing import Callable
+
+Generator = Callable[[random.Random, float], str]
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def _count(base: int, scale: float) -> int:
+    """Scales a number of records."""
+    return max(1, round(base * scale))
+
+
+def _side(base: int, scale: float) -> int:
+    """Scales the side of a square grid so its area grows with scale."""
+    return max(4, isqrt(round(base * base * scale)))
+
+
+def day01(rng: random.Random, scale: float) -> str:
+    """Two columns of five digit location IDs. About half the right column is
+    drawn from the left so that the similarity score isn't zero."""
+    n = _count(1000, scale)
+    left = [rng.randint(10000, 99999) for _ in range(n)]
+    right = [rng.choice(left) if rng.random() < 0.5
+             else rng.randint(10000, 99999) for _ in range(n)]
+    return ''.join(f'{a}   {b}\n' for a, b in zip(left, right))
+
+
+def day02(rng: random.Random, scale: float) -> str:
+    """Reports of 5 to 8 levels, mostly monotonic with a few faults."""
+    lines = []
+    for _ in range(_count(1000, scale)):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(30, 70)
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += sign * rng.randint(1, 3)
+            report.append(level)
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            report[rng.randrange(len(report))] += rng.randint(-4, 4)
+        lines.append(' '.join(str(x) for x in report))
+    return '\n'.join(lines) + '\n'
+
+
+def day03(rng: random.Random, scale: float) -> str:
+    """Corrupted memory: junk with mul(x,y), do() and don't() mixed in, along
+    with near misses like mul[3,7] and mul(4*."""
+    size = _count(18000, scale)
+    junk = "!@#$%^&*()[]{}<>?/+-,' ~:;whatselectfromwhyhowwhereupmuldon"
+    fragments = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.45:
+            fragment = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+        elif roll < 0.5:
+            fragment = rng.choice(('do()', "don't()"))
+        elif roll < 0.6:
+            fragment = rng.choice(('mul(', 'mul[3,7]', 'mul(4*',
+                                   'mul ( 2 , 4 )', "don't", 'do(',
+                                   'mul(12,'))
+        else:
+            fragment = ''.join(rng.choices(junk, k=rng.randint(1, 12)))
+        fragments.append(fragment)
+        length += len(fragment)
+        if rng.random() < 0.001:
+            fragments.append('\n')
+    return ''.join(fragments) + '\n'
+
+
+def _grid(rows: list[str]) -> str:
+    return '\n'.join(rows) + '\n'
+
+
+def day04(rng: random.Random, scale: float) -> str:
+    """A square word search of X, M, A and S."""
+    side = _side(140, scale)
+    return _grid([''.join(rng.choices('XMAS', k=side)) for _ in range(side)])
+
+
+def day05(rng: random.Random, scale: float) -> str:
+    """A complete set of ordering rules over 49 pages, then updates of odd
+    length, about half of which are already in order."""
+    pages = rng.sample(range(10, 100), 49)
+    position = {page: i for i, page in enumerate(pages)}
+    rules = [f'{a}|{b}' for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(_count(190, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=position.__getitem__)
+        updates.append(','.join(str(x) for x in update))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates) + '\n'
+
+
+def day06(rng: random.Random, scale: float) -> str:
+    """A lab with scattered obstructions and the guard facing up."""
+    side = _side(130, scale)
+    rows = [rng.choices('.#', weights=(95, 5), k=side) for _ in range(side)]
+    r, c = rng.randrange(side), rng.randrange(side)
+    rows[r][c] = '^'
+    return _grid([''.join(row) for row in rows])
+
+
+def day07(rng: random.Random, scale: float) -> str:
+    """Equations built left to right from +, * and ||. About a third of the
+    test values are nudged so that they can't be made."""
+    lines = []
+    for _ in range(_count(850, scale)):
+        numbers = [rng.choice((rng.randint(1, 9), rng.randint(1, 999)))
+                   for _ in range(rng.randint(2, 12))]
+        total = numbers[0]
+        for n in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+' or total > 10 ** 12:
+                total += n
+            elif op == '*':
+                total *= n
+            else:
+                total = int(f'{total}{n}')
+        if rng.random() < 0.33:
+            total += rng.randint(1, 9)
+        lines.append(f'{total}: ' + ' '.join(str(x) for x in numbers))
+    return '\n'.join(lines) + '\n'
+
+
+def day08(rng: random.Random, scale: float) -> str:
+    """A map with a few antennae per frequency."""
+    side = _side(50, scale)
+    rows = [['.'] * side for _ in range(side)]
+    frequencies = '0123456789' + LETTERS + LETTERS.lower()
+    for _ in range(side * side // 12):
+        frequency = rng.choice(frequencies)
+        rows[rng.randrange(side)][rng.randrange(side)] = frequency
+    return _grid([''.join(row) for row in rows])
+
+
+def day09(rng: random.Random, scale: float) -> str:
+    """A disk map of alternating file and free space digits, ending in a
+    file."""
+    n = _count(9999, scale)
+    files = rng.choices('123456789', k=n + 1)
+    spaces = rng.choices('0123456789', k=n) + ['']
+    return ''.join(f + s for f, s in zip(files, spaces)) + '\n'
+
+
+def day10(rng: random.Random, scale: float) -> str:
+    """A topographic map of random heights with hiking trails (0 to 9 in
+    single steps) carved into it."""
+    side = _side(45, scale)
+    rows = [rng.choices('0123456789', k=side) for _ in range(side)]
+    carved: set[tuple[int, int]] = set()
+    for _ in range(side * side // 20):
+        trail = [(rng.randrange(side), rng.randrange(side))]
+        while trail[0] not in carved and len(trail) < 10:
+            # Step to a cell in the grid and not on this or another trail
+            r, c = trail[-1]
+            options = [(r + dr, c + dc)
+                       for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                       if 0 <= r + dr < side and 0 <= c + dc < side
+                       and (r + dr, c + dc) not in carved
+                       and (r + dr, c + dc) not in trail]
+            if not options:
+                break
+            trail.append(rng.choice(options))
+        if len(trail) < 10:
+            continue
+        carved.update(trail)
+        for (r, c), height in zip(trail, '0123456789'):
+            rows[r][c] = height
+    return _grid([''.join(row) for row in rows])
+
+
+def day11(rng: random.Random, scale: float) -> str:
+    """A line of engraved stones."""
+    n = _count(8, scale)
+    return ' '.join(str(rng.randint(0, 9999999)) for _ in range(n)) + '\n'
+
+
+def day12(rng: random.Random, scale: float) -> str:
+    """A garden of rectangular plots, roughly blocky with some stray plants
+    so regions get irregular edges."""
+    side = _side(140, scale)
+    block = 4
+    rows = []
+    for _ in range(0, side, block):
+        letters = rng.choices(LETTERS, k=side // block + 1)
+        row = ''.join(x * block for x in letters)[:side]
+        for _ in range(block):
+            cells = list(row)
+            for _ in range(side // 20):
+                cells[rng.randrange(side)] = rng.choice(LETTERS)
+            rows.append(''.join(cells))
+    return _grid(rows[:side])
+
+
+def day13(rng: random.Random, scale: float) -> str:
+    """Claw machines, about half of which can reach their prize."""
+    machines = []
+    for _ in range(_count(320, scale)):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if ay * bx != ax * by:
+                break
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f'Button A: X+{ax}, Y+{ay}\n'
+                        f'Button B: X+{bx}, Y+{by}\n'
+                        f'Prize: X={px}, Y={py}\n')
+    return '\n'.join(machines)
+
+
+def day14(rng: random.Random, scale: float) -> str:
+    """Robots on the 101x103 floor (the size main expects)."""
+    lines = []
+    for _ in range(_count(500, scale)):
+        lines.append(f'p={rng.randrange(101)},{rng.randrange(103)} '
+                     f'v={rng.randint(-99, 99)},{rng.randint(-99, 99)}')
+    return '\n'.join(lines) + '\n'
+
+
+def day15(rng: random.Random, scale: float) -> str:
+    """A walled warehouse of boxes and the robot's list of moves."""
+    side = _side(50, scale)
+    rows = [['#'] * side]
+    for _ in range(side - 2):
+        rows.append(['#'] + rng.choices('.#O', weights=(60, 10, 30),
+                                        k=side - 2) + ['#'])
+    rows.append(['#'] * side)
+    rows[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = '@'
+    moves = ''.join(rng.choices('<>^v', k=_count(20000, scale)))
+    lines = [moves[i:i+1000] for i in range(0, len(moves), 1000)]
+    return (_grid([''.join(row) for row in rows]) + '\n'
+            + '\n'.join(lines) + '\n')
+
+
+def day16(rng: random.Random, scale: float) -> str:
+    """A maze carved by a randomised depth-first search, with some extra walls
+    knocked out so that there is more than one route. S is in the bottom left
+    corner and E in the top right."""
+    side = _side(141, scale) | 1
+    rows = [['#'] * side for _ in range(side)]
+    start = (side - 2, 1)
+    rows[start[0]][start[1]] = '.'
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [(dr, dc) for dr, dc in ((0, 2), (2, 0), (0, -2), (-2, 0))
+                   if 0 < r + dr < side - 1 and 0 < c + dc < side - 1
+                   and rows[r + dr][c + dc] == '#']
+        if not options:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(options)
+        rows[r + dr // 2][c + dc // 2] = '.'
+        rows[r + dr][c + dc] = '.'
+        stack.append((r + dr, c + dc))
+    for _ in range(side * side // 50):
+        r, c = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        rows[r][c] = '.'
+    rows[start[0]][start[1]] = 'S'
+    rows[1][side - 2] = 'E'
+    return _grid([''.join(row) for row in rows])
+
+
+def _quine_exists(program: list[int], k1: int, k2: int) -> bool:
+    """Checks that some value of A makes the program below print itself."""
+    def first_output(a: int) -> int:
+        b = (a & 7) ^ k1
+        return (b ^ (a >> b) ^ k2) & 7
+
+    candidates = [0]
+    for n in reversed(program):
+        candidates = [(a << 3) + bits
+                      for a in candidates for bits in range(8)
+                      if (a << 3) + bits
+                      and first_output((a << 3) + bits) == n]
+    return bool(candidates)
+
+
+def day17(rng: random.Random, scale: float) -> str:
+    """A program of the usual shape (output three bits of A, shift, repeat)
+    that has a Part 2 answer, and an A register that produces 16 * scale
+    outputs."""
+    while True:
+        k1, k2 = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, k1, 7, 5, 4, 5, 0, 3, 1, k2, 5, 5, 3, 0]
+        if _quine_exists(program, k1, k2):
+            break
+    bits = 3 * _count(16, scale)
+    a = rng.getrandbits(bits) | 1 << (bits - 1)
+    return (f'Register A: {a}\nRegister B: 0\nRegister C: 0\n\n'
+            f'Program: {",".join(str(x) for x in program)}\n')
+
+
+def day18(rng: random.Random, scale: float) -> str:
+    """Falling bytes on the 71x71 memory space main expects. Every cell except
+    the corners falls eventually, but the first 1024 leave a path open. The
+    grid size is fixed by main, so scale is ignored."""
+    size = 71
+    cells = [(x, y) for x in range(size) for y in range(size)
+             if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    while True:
+        rng.shuffle(cells)
+        blocked = set(cells[:1024])
+        seen = {(0, 0)}
+        queue = deque(seen)
+        while queue:
+            x, y = queue.popleft()
+            for n in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if (0 <= n[0] < size and 0 <= n[1] < size and
+                        n not in blocked and n not in seen):
+                    seen.add(n)
+                    queue.append(n)
+        if (size - 1, size - 1) in seen:
+            break
+    return ''.join(f'{x},{y}\n' for x, y in cells)
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day01, 2: day02, 3: day03, 4: day04, 5: day05, 6: day06,
+    7: day07, 8: day08, 9: day09, 10: day10, 11: day11, 12: day12,
+    13: day13, 14: day14, 15: day15, 16: day16, 17: day17, 18: day18,
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 2024) -> str:
+    """Generates an input for a day at a multiple of the real puzzle size."""
+    return GENERATORS[day](random.Random(f'{day}-{seed}'), scale)
+
+
+def input_path(directory: Path, day: int, scale: float) -> Path:
+    """Where a generated input is written: directory/NN/xSCALE.txt, which is
+    the layout the runner reads inputs from."""
+    return directory / f'{day:02}' / f'x{scale:g}.txt'
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('days', nargs='*', type=int, metavar='DAY')
+    parser.add_argument('-s', '--scale', type=float, nargs='+', default=[1])
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('-o', '--out', type=Path,
+                        help='write DIR/NN/xSCALE.txt instead of stdout')
+    args = parser.parse_args(argv)
+
+    days = args.days or list(GENERATORS)
+    if args.out is None:
+        if len(days) != 1 or len(args.scale) != 1:
+            parser.error('pick one day and scale, or use --out')
+        sys.stdout.write(generate(days[0], args.scale[0], args.seed))
+        return 0
+
+    for day in days:
+        for scale in args.scale:
+            path = input_path(args.out, day, scale)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(generate(day, scale, args.seed))
+            print(path, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
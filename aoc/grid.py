@@ -0,0 +1,161 @@
+"""Character grids as uint8 NumPy arrays.
+
+np.array([list(line) for line in lines]) builds a Python list per row and a
+four byte unicode cell per character, and every comparison against it is a
+string comparison. parse_grid instead views the raw input bytes as an (H, W)
+uint8 array, slicing off the newline column, so each cell is one byte and no
+per-cell objects are created. Compare cells against ord('#') and so on.
+
+For graph searches over a grid, steps and adjacency build neighbour tables
+once per grid. Cells are numbered row * width + column, and the tables hold
+those ids, so a search can walk plain integers instead of building and
+bounds-checking coordinate tuples on every visit. The unmasked table depends
+only on the grid's shape, so it is cached and shared by every grid of that
+shape (e.g. across a batch of inputs).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable
+
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    Edge = Callable[[NDArray, NDArray], NDArray[np.bool_]]
+else:
+    np = lazy_import('numpy')
+
+NEWLINE = ord('\n')
+
+# East, south, west, north: turning right is +1, turning left is -1
+FOUR_WAY = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+def parse_grid(data: str | bytes) -> NDArray[np.uint8]:
+    """Views a rectangular block of text as an (H, W) array of byte values.
+    Bytes that end in a newline are viewed without copying (the result is
+    then read-only); strings are encoded first.
+
+    >>> grid = parse_grid('ABCD\\nEFGH\\nIJKL\\n')
+    >>> grid
+    array([[65, 66, 67, 68],
+           [69, 70, 71, 72],
+           [73, 74, 75, 76]], dtype=uint8)
+    >>> grid[1].tobytes()
+    b'EFGH'
+    >>> parse_grid('AB\\nCDE')
+    Traceback (most recent call last):
+    ...
+    ValueError: Grid rows must all be the same length
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    end = len(data)
+    while end and data[end - 1] == NEWLINE:
+        end -= 1
+    width = data.find(b'\n', 0, end)
+    if width == -1:
+        width = end
+    height = (end + 1) // (width + 1)
+    if height * (width + 1) != end + 1:
+        raise ValueError('Grid rows must all be the same length')
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if len(buffer) > end:
+        buffer = buffer[:end + 1]
+    else:
+        # No trailing newline to make the last row full length
+        buffer = np.append(buffer, np.uint8(NEWLINE))
+    grid = buffer.reshape(height, width + 1)
+    if not (grid[:, width] == NEWLINE).all():
+        raise ValueError('Grid rows must all be the same length')
+    return grid[:, :width]
+
+
+def find_cell(grid: NDArray[np.uint8], char: str) -> tuple[int, int]:
+    """Returns the (row, column) of the first cell holding a character.
+
+    >>> find_cell(parse_grid('#S.\\n..E\\n'), 'E')
+    (1, 2)
+    """
+    value = ord(char)
+    index = int(np.argmax(grid == value))
+    row, column = divmod(index, grid.shape[1])
+    if grid[row, column] != value:
+        raise ValueError(f'{char!r} is not in the grid')
+    return row, column
+
+
+@lru_cache(maxsize=32)
+def _step_table(shape: tuple[int, int],
+                offsets: tuple[tuple[int, int], ...]) -> NDArray[np.int32]:
+    """Builds the unmasked steps table (read-only, since it's shared)."""
+    height, width = shape
+    ids = np.arange(height * width, dtype=np.int32).reshape(shape)
+    table = np.full((len(offsets), height, width), -1, dtype=np.int32)
+    for k, (dr, dc) in enumerate(offsets):
+        rows = slice(max(0, -dr), height - max(0, dr))
+        cols = slice(max(0, -dc), width - max(0, dc))
+        to_rows = slice(rows.start + dr, rows.stop + dr)
+        to_cols = slice(cols.start + dc, cols.stop + dc)
+        table[k, rows, cols] = ids[to_rows, to_cols]
+    table = table.reshape(len(offsets), -1)
+    table.flags.writeable = False
+    return table
+
+
+def steps(shape: tuple[int, ...],
+          passable: NDArray[np.bool_] | None = None,
+          offsets: tuple[tuple[int, int], ...] = FOUR_WAY
+          ) -> NDArray[np.int32]:
+    """Returns a (len(offsets), H * W) table of the cell reached by one step
+    from each cell in each direction, or -1 if the step leaves the grid. With
+    a passable mask, steps from or onto impassable cells are -1 too. Without
+    one, the table is shared between calls and read-only.
+
+    >>> steps((2, 3))
+    array([[ 1,  2, -1,  4,  5, -1],
+           [ 3,  4,  5, -1, -1, -1],
+           [-1,  0,  1, -1,  3,  4],
+           [-1, -1, -1,  0,  1,  2]], dtype=int32)
+    """
+    height, width = shape
+    table = _step_table((height, width), offsets)
+    if passable is not None:
+        # The extra closed cell at the end is what -1 (off the grid) indexes
+        open_cells = np.append(passable.ravel(), False)
+        table = table.copy()
+        table[~open_cells[table] | ~open_cells[None, :-1]] = -1
+    return table
+
+
+def adjacency(grid: NDArray,
+              edge: Edge | None = None,
+              passable: NDArray[np.bool_] | None = None,
+              offsets: tuple[tuple[int, int], ...] = FOUR_WAY
+              ) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+    """Builds a compressed (CSR) neighbour table for a grid: the neighbours of
+    cell i are targets[starts[i]:starts[i + 1]], in the order of offsets. Edges
+    can be filtered with a passable mask and with edge(from, to), which is
+    called once with the grid values at both ends of every candidate edge.
+
+    >>> heights = np.array([[0, 1], [1, 2]])
+    >>> starts, targets = adjacency(heights, lambda a, b: b == a + 1)
+    >>> starts
+    array([0, 2, 3, 4, 4], dtype=int32)
+    >>> targets
+    array([1, 2, 3, 3], dtype=int32)
+    """
+    table = steps(grid.shape, passable, offsets).T
+    valid = table >= 0
+    if edge is not None:
+        values = grid.ravel()
+        sources = np.broadcast_to(np.arange(len(values))[:, None], table.shape)
+        valid &= edge(values[sources], values[np.where(valid, table, 0)])
+    starts = np.zeros(len(table) + 1, dtype=np.int32)
+    np.cumsum(valid.sum(axis=1), out=starts[1:])
+    return starts, table[valid]
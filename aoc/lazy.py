@@ -0,0 +1,50 @@
+"""Deferred imports.
+
+Importing NumPy takes about 80 ms, several times longer than solving most
+days on their real inputs. Modules that only need it for some inputs (or
+only for some functions) bind it with lazy_import instead, which returns the
+module straight away but only runs its code on first attribute access:
+
+    np = lazy_import('numpy')
+
+Annotations that mention NumPy types must then not be evaluated at import
+time, so those modules use from __future__ import annotations and import
+numpy.typing under TYPE_CHECKING.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+# Names bound by lazy_import, whether or not they've been loaded since
+_LAZY: set[str] = set()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns the named module, loading it on first attribute access if it
+    hasn't been imported already.
+
+    >>> colorsys = lazy_import('colorsys')
+    >>> colorsys.rgb_to_hsv(1, 0, 0)
+    (0.0, 1.0, 1)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    _LAZY.add(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def load_all():
+    """Finishes loading every module bound by lazy_import, e.g. so the cost
+    isn't charged to whatever happens to touch it first."""
+    for name in _LAZY:
+        # Any attribute access completes a lazy load
+        getattr(sys.modules[name], '__name__')
@@ -0,0 +1,177 @@
+"""Peak memory and allocation sites for a solver run, via tracemalloc.
+
+tracemalloc's peak counter is exact, but a snapshot only shows what is live
+when it's taken, and by the time a solver returns most of its working memory
+is gone. So while tracing, a sampler thread polls the traced total and takes
+a fresh snapshot each time it climbs past the last one by a margin; the
+allocation sites reported are those of the snapshot nearest the peak. Each
+report also divides the peak by the number of records (non-blank lines) in
+the input, which is what scales with input size when sizing memory limits.
+NumPy reports its array buffers to tracemalloc, so they are counted too.
+
+    python -m aoc.runner --memory 2 7 10
+    python -m aoc.runner --memory 20 -f big.txt 16   # top 20 sites
+
+Tracing slows allocation-heavy code down several times, so the times printed
+alongside are not comparable with an untraced run.
+"""
+
+import re
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parents[1]
+# Poll every few milliseconds; retake the snapshot after 5% growth
+INTERVAL = 0.005
+GROWTH = 1.05
+TOP = 10
+
+_RECORD = re.compile(rb'^[ \t\r]*[^\s]', re.MULTILINE)
+
+
+class Site(NamedTuple):
+    """Memory live at one line of source when the snapshot was taken."""
+    location: str
+    size: int
+    count: int
+
+
+class MemoryReport(NamedTuple):
+    """The peak traced memory of a run, and the top allocation sites in the
+    snapshot taken nearest to it (snapshot_size bytes in that many blocks
+    were live then)."""
+    peak: int
+    snapshot_size: int
+    blocks: int
+    sites: list[Site]
+    records: int
+
+    @property
+    def per_record(self) -> float:
+        return self.peak / max(self.records, 1)
+
+    @property
+    def blocks_per_record(self) -> float:
+        return self.blocks / max(self.records, 1)
+
+
+def records(data: str | bytes) -> int:
+    """Counts the records (non-blank lines) in an input.
+
+    >>> records('3   4\\n4   3\\n\\n2   5\\n'), records(b'7 6\\n \\n1 2')
+    (3, 2)
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return sum(1 for _ in _RECORD.finditer(data))
+
+
+def _location(frame: tracemalloc.Frame) -> str:
+    """Shortens a frame's file to be relative to the repository, or failing
+    that to the sys.path entry it was imported from."""
+    path = Path(frame.filename)
+    for base in [ROOT, *map(Path, sorted(sys.path, key=len, reverse=True))]:
+        if base.is_absolute() and path.is_relative_to(base):
+            path = path.relative_to(base)
+            break
+    return f'{path}:{frame.lineno}'
+
+
+class Tracer:
+    """Traces allocations inside a with block, keeping the snapshot taken
+    nearest to peak memory.
+
+    >>> with Tracer() as tracer:
+    ...     block = bytearray(1 << 20)
+    ...     del block
+    >>> report = tracer.report(records=4)
+    >>> report.peak >= 1 << 20, report.per_record >= 1 << 18
+    (True, True)
+    """
+    def __init__(self, interval: float = INTERVAL):
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self.peak = 0
+        self._done = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._lock = threading.Lock()
+
+    def _check(self, force: bool = False):
+        """Takes a snapshot if traced memory has grown enough since the last
+        one."""
+        with self._lock:
+            current, _ = tracemalloc.get_traced_memory()
+            if force or current > self.snapshot_size * GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def _sample(self):
+        while not self._done.wait(self.interval):
+            self._check()
+
+    def __enter__(self) -> 'Tracer':
+        tracemalloc.start()
+        self._check(force=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._done.set()
+        self._sampler.join()
+        # Catch a peak in a run too short for the sampler to have seen it
+        self._check()
+        _, self.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    def report(self, records: int = 0, top: int = TOP) -> MemoryReport:
+        """Returns the peak and the top allocation sites by size."""
+        blocks, sites = 0, []
+        if self.snapshot is not None:
+            snapshot = self.snapshot.filter_traces([
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap*'),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__)])
+            stats = snapshot.statistics('lineno')
+            blocks = sum(stat.count for stat in stats)
+            sites = [Site(_location(stat.traceback[0]), stat.size, stat.count)
+                     for stat in stats[:top]]
+        return MemoryReport(self.peak, self.snapshot_size, blocks, sites,
+                            records)
+
+
+def _size(n: float) -> str:
+    """Formats a byte count.
+
+    >>> _size(512), _size(3 << 20)
+    ('512 B', '3.0 MiB')
+    """
+    for unit in ('B', 'KiB', 'MiB'):
+        if n < 1024:
+            return f'{n:.0f} {unit}' if unit == 'B' else f'{n:.1f} {unit}'
+        n /= 1024
+    return f'{n:.1f} GiB'
+
+
+def format_report(report: MemoryReport, indent: str = '    ') -> str:
+    """Formats a report as indented lines: the peak, then one line per site.
+
+    >>> print(format_report(MemoryReport(
+    ...     3 << 20, 3 << 20, 1500, [Site('02/part2.py:40', 2 << 20, 1000)],
+    ...     1000)))
+        peak 3.0 MiB, 3.1 KiB per record (1000 records)
+        snapshot at 3.0 MiB, 1.5 blocks per record:
+           2.0 MiB      1000 blocks  02/part2.py:40
+    """
+    lines = [f'{indent}peak {_size(report.peak)}, '
+             f'{_size(report.per_record)} per record '
+             f'({report.records} records)',
+             f'{indent}snapshot at {_size(report.snapshot_size)}, '
+             f'{report.blocks_per_record:.1f} blocks per record:']
+    lines += [f'{indent}{_size(site.size):>10} {site.count:>9} blocks  '
+              f'{site.location}' for site in report.sites]
+    return '\n'.join(lines)
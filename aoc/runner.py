@@ -0,0 +1,461 @@
+"""Runs the daily solutions in a single interpreter.
+
+Every NN/partN.py imports its siblings by bare name (from part1 import parse),
+so two days can't normally be imported side by side. This module loads each
+day under unique module names (day01_part1, day01_part2, ...), feeds it the
+puzzle input once, and reports the answer along with the time spent parsing
+and solving.
+
+    python -m aoc.runner                  # every day, inputs from NN/*.txt
+    python -m aoc.runner 4 16.2           # day 4 (both parts), day 16 part 2
+    python -m aoc.runner 1 -f input.txt   # a specific input file
+    python -m aoc.runner -j 8             # spread the runs over 8 processes
+    python -m aoc.runner --cache          # reuse answers from earlier runs
+    python -m aoc.runner --counters 16    # hot-path counters (aoc.instrument)
+    python -m aoc.runner --memory 2 7     # peak memory and sites (aoc.memory)
+    python -m aoc.runner --mmap 9         # memory-map inputs (aoc.stream)
+    python -m aoc.runner --engine numpy 1 # main_numpy where a day has one
+"""
+
+import argparse
+import importlib.util
+import inspect
+import io
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple
+
+from aoc import instrument
+from aoc.cache import DEFAULT_DIR, Cache
+from aoc.lazy import load_all
+from aoc.memory import TOP, MemoryReport, Tracer, format_report, records
+from aoc.stream import mapped
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class Solver(NamedTuple):
+    """Describes how to call one part of one day. The parse hook is the name
+    (optionally dotted, e.g. Field.__init__) of the function the entry point
+    uses to parse its input; time spent inside it is reported as parse time.
+    Solvers marked mmap also take their input as bytes, such as a memory-mapped
+    file.
+    """
+    day: int
+    part: int
+    entry: str = 'main'
+    args: tuple[Any, ...] = ()
+    parse: str | None = 'parse'
+    output: Callable[[Any], str] = str
+    mmap: bool = False
+
+
+class Result(NamedTuple):
+    """The answer and timings for one solver on one input, with the solver's
+    instrument report if it was run with counters and its memory report if
+    it was traced. Cached answers have no timings."""
+    day: int
+    part: int
+    source: str
+    answer: str
+    parse_time: float
+    solve_time: float
+    cached: bool = False
+    report: dict[str, Any] | None = None
+    memory: MemoryReport | None = None
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.solve_time
+
+
+def _comma_join(values: Any) -> str:
+    return ','.join(str(x) for x in values)
+
+
+SOLVERS = {(s.day, s.part): s for s in [
+    Solver(1, 1),
+    Solver(1, 2),
+    Solver(2, 1),
+    Solver(2, 2),
+    Solver(3, 1, parse=None, mmap=True),
+    Solver(3, 2, parse=None, mmap=True),
+    Solver(4, 1, args=('XMAS',), mmap=True),
+    Solver(4, 2, args=('MAS',), mmap=True),
+    Solver(5, 1),
+    Solver(5, 2),
+    Solver(6, 1),
+    Solver(6, 2),
+    Solver(7, 1),
+    Solver(7, 2),
+    Solver(8, 1),
+    Solver(8, 2),
+    Solver(9, 1, mmap=True),
+    Solver(9, 2, mmap=True),
+    Solver(10, 1, parse='TopoMap.__init__'),
+    Solver(10, 2, parse='TopoMap.__init__'),
+    Solver(11, 1, args=(25,), parse='init_pebbles'),
+    Solver(11, 2, args=(75,), parse='init_pebbles'),
+    Solver(12, 1, parse='Field.__init__', mmap=True),
+    Solver(12, 2, parse='Field.__init__', mmap=True),
+    Solver(13, 1),
+    Solver(13, 2),
+    Solver(14, 1),
+    Solver(14, 2, entry='find_tree'),
+    Solver(15, 1, parse='Warehouse.__init__'),
+    Solver(15, 2, parse='Warehouse.__init__'),
+    Solver(16, 1),
+    Solver(16, 2),
+    Solver(17, 1, parse=None, output=_comma_join),
+    Solver(17, 2),
+    Solver(18, 1),
+    Solver(18, 2, parse='part1.parse', output=_comma_join),
+]}
+
+_IMPORT = re.compile(r'^\s*(?:from|import)\s+(\w+)', re.MULTILINE)
+
+
+def load(day: int, name: str) -> ModuleType:
+    """Imports NN/name.py as dayNN_name. Bare imports of sibling modules
+    inside it resolve to the same day's modules, loaded the same way.
+    """
+    key = f'day{day:02}_{name}'
+    if key in sys.modules:
+        return sys.modules[key]
+
+    directory = ROOT / f'{day:02}'
+    path = directory / f'{name}.py'
+    siblings = {p.stem for p in directory.glob('*.py')}
+    dependencies = [x for x in _IMPORT.findall(path.read_text())
+                    if x in siblings and x != name]
+    loaded = {x: load(day, x) for x in dependencies}
+
+    # Swap out anything using a sibling's bare name (e.g. another day's part1)
+    saved = {x: sys.modules.pop(x) for x in siblings if x in sys.modules}
+    sys.modules.update(loaded)
+    sys.path.insert(0, str(directory))
+    try:
+        spec = importlib.util.spec_from_file_location(key, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Can't load {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
+    finally:
+        sys.path.remove(str(directory))
+        for x in siblings:
+            sys.modules.pop(x, None)
+        sys.modules.update(saved)
+    return module
+
+
+def _timed_generator(generator: Iterator[Any], clock: list[float]):
+    """Yields from a generator, adding the time spent inside it to clock."""
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(generator)
+        except StopIteration:
+            return
+        finally:
+            clock[0] += time.perf_counter() - start
+        yield item
+
+
+@contextmanager
+def _timing(namespace: dict[str, Any], name: str, clock: list[float]):
+    """Temporarily wraps the function at name (looked up in namespace) so the
+    time spent inside it is added to clock.
+    """
+    first, *rest = name.split('.')
+    if rest:
+        owner = namespace[first]
+        for attr in rest[:-1]:
+            owner = getattr(owner, attr)
+        attr = rest[-1]
+        inherited = attr not in vars(owner)
+        original = getattr(owner, attr)
+    else:
+        owner, attr, inherited = None, first, False
+        original = namespace[first]
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = original(*args, **kwargs)
+        finally:
+            clock[0] += time.perf_counter() - start
+        if inspect.isgenerator(result):
+            return _timed_generator(result, clock)
+        return result
+
+    if owner is None:
+        namespace[attr] = wrapper
+    else:
+        setattr(owner, attr, wrapper)
+    try:
+        yield
+    finally:
+        if owner is None:
+            namespace[attr] = original
+        elif inherited:
+            delattr(owner, attr)
+        else:
+            setattr(owner, attr, original)
+
+
+def _takes_stream(function: Callable[..., Any]) -> bool:
+    """Whether a function's first parameter is a binary stream, as the
+    main_stream entry points' is."""
+    parameters = list(inspect.signature(function).parameters.values())
+    return bool(parameters) and parameters[0].annotation in (BinaryIO,
+                                                             'BinaryIO')
+
+
+def run(solver: Solver, data: str | bytes, source: str = '-',
+        counters: bool = False, memory: int | None = None) -> Result:
+    """Runs a solver on an input and times it, along with its
+    instrument report if counters is set. If memory is set, the run is traced
+    with tracemalloc and reports that many of the top allocation sites.
+
+    >>> stream = with_engine(SOLVERS[(1, 1)], 'stream')
+    >>> result = run(stream, '3   4\\n4   3\\n1   2\\n', memory=1)
+    >>> result.answer, result.memory.records
+    ('1', 3)
+    """
+    module = load(solver.day, f'part{solver.part}')
+    function = getattr(module, solver.entry)
+    argument: str | bytes | BinaryIO = data
+    if _takes_stream(function):
+        argument = io.BytesIO(data.encode() if isinstance(data, str)
+                              else data)
+    clock = [0.0]
+    timing = (nullcontext() if solver.parse is None else
+              _timing(function.__globals__, solver.parse, clock))
+    # Don't charge NumPy's (deferred) import to the first timed or traced run
+    load_all()
+    tracer = None
+    if memory:
+        tracer = Tracer()
+    instrument.enable(counters)
+    instrument.reset()
+    try:
+        with timing, tracer or nullcontext():
+            start = time.perf_counter()
+            answer = function(argument, *solver.args)
+            total = time.perf_counter() - start
+    finally:
+        instrument.enable(False)
+    return Result(solver.day, solver.part, source, solver.output(answer),
+                  clock[0], total - clock[0],
+                  report=instrument.report() if counters else None,
+                  memory=tracer and tracer.report(records(data), memory))
+
+
+def run_cached(solver: Solver, data: str | bytes, source: str = '-',
+               cache: Cache | None = None, counters: bool = False,
+               memory: int | None = None) -> Result:
+    """Returns the cached answer for a solver on an input if there is one,
+    otherwise runs the solver and caches its answer."""
+    if cache is None:
+        return run(solver, data, source, counters, memory)
+    raw = data.encode() if isinstance(data, str) else data
+    key = cache.key(solver.day, solver.part, raw, solver.entry,
+                    repr(solver.args), solver.output.__name__)
+    answer = cache.get(key)
+    if answer is not None:
+        return Result(solver.day, solver.part, source, answer, 0.0, 0.0,
+                      cached=True)
+    result = run(solver, data, source, counters, memory)
+    cache.put(key, result.answer)
+    return result
+
+
+def select(selectors: list[str]) -> list[Solver]:
+    """Turns selectors like '4' (both parts) or '16.2' into solvers."""
+    if not selectors:
+        return list(SOLVERS.values())
+    solvers = []
+    for selector in selectors:
+        day, _, part = selector.partition('.')
+        parts = [int(part)] if part else [1, 2]
+        for p in parts:
+            if (int(day), p) not in SOLVERS:
+                raise ValueError(f'No solver for day {day} part {p}')
+            solvers.append(SOLVERS[(int(day), p)])
+    return solvers
+
+
+def _takes_path(function: Callable[..., Any]) -> bool:
+    """Whether a function's first parameter is a file path, as the
+    main_parallel entry points' is."""
+    parameters = list(inspect.signature(function).parameters.values())
+    return bool(parameters) and 'PathLike' in str(parameters[0].annotation)
+
+
+def with_engine(solver: Solver, engine: str) -> Solver:
+    """Switches a solver to another implementation of its entry point, e.g.
+    main_numpy for engine 'numpy', timing parse_numpy as its parse if the day
+    has one. Solvers whose day has no such engine are returned unchanged, as
+    are those whose engine takes a file path rather than the input (the
+    runner hands solvers the input itself).
+
+    >>> with_engine(SOLVERS[(1, 2)], 'numpy').entry
+    'main_numpy'
+    >>> with_engine(SOLVERS[(1, 2)], 'parallel').entry
+    'main'
+    """
+    module = load(solver.day, f'part{solver.part}')
+    entry = f'{solver.entry}_{engine}'
+    function = getattr(module, entry, None)
+    if not callable(function) or _takes_path(function):
+        return solver
+    parse = f'parse_{engine}'
+    return solver._replace(entry=entry,
+                           parse=parse if hasattr(module, parse)
+                           else solver.parse)
+
+
+def find_inputs(day: int, inputs: Path) -> list[Path]:
+    """Returns the input files for a day, i.e. inputs/NN/*.txt."""
+    return sorted((inputs / f'{day:02}').glob('*.txt'))
+
+
+def format_result(result: Result) -> str:
+    """Formats a result as one line of the report, followed by its counters
+    and memory report if it has them."""
+    line = (f'{result.day:02}.{result.part}  {result.source:<24} '
+            f'{result.answer:>20}')
+    if result.cached:
+        return f'{line}  cached'
+    line = (f'{line}  parse {result.parse_time * 1000:9.2f} ms'
+            f'  solve {result.solve_time * 1000:9.2f} ms')
+    if result.report:
+        line = '\n'.join(filter(None, [
+            line, instrument.format_report(result.report)]))
+    if result.memory:
+        line = f'{line}\n{format_report(result.memory)}'
+    return line
+
+
+def jobs(solvers: list[Solver],
+         files: list[Path],
+         inputs: Path,
+         mmap: bool = False) -> Iterator[tuple[Solver, str | bytes, str]]:
+    """Yields (solver, input, source) for each solver and each of its inputs.
+    Each input is read once and handed to every selected part of its day.
+    With mmap, solvers that take bytes are handed the file memory-mapped
+    instead; the mapping is closed when the next job is asked for, so each
+    job must be run before then.
+    """
+    by_day: dict[int, list[Solver]] = {}
+    for solver in solvers:
+        by_day.setdefault(solver.day, []).append(solver)
+    for day, day_solvers in by_day.items():
+        for path in files or find_inputs(day, inputs):
+            data = None
+            for solver in day_solvers:
+                if mmap and solver.mmap:
+                    with mapped(path) as view:
+                        yield solver, view, str(path)
+                    continue
+                if data is None:
+                    data = path.read_text()
+                yield solver, data, str(path)
+
+
+def run_all(solvers: list[Solver],
+            files: list[Path],
+            inputs: Path,
+            cache: Cache | None = None,
+            counters: bool = False,
+            memory: int | None = None,
+            mmap: bool = False) -> Iterator[Result]:
+    """Runs each solver on its inputs, one after another."""
+    for solver, data, source in jobs(solvers, files, inputs, mmap):
+        yield run_cached(solver, data, source, cache, counters, memory)
+
+
+def _run_job(job: tuple[Solver, str, str], cache: Cache | None,
+             counters: bool, memory: int | None) -> Result:
+    return run_cached(*job, cache=cache, counters=counters, memory=memory)
+
+
+def run_parallel(solvers: list[Solver],
+                 files: list[Path],
+                 inputs: Path,
+                 workers: int | None = None,
+                 cache: Cache | None = None,
+                 counters: bool = False,
+                 memory: int | None = None) -> list[Result]:
+    """Runs each solver on its inputs across a process pool (one process per
+    CPU by default). Each worker imports a day the first time it sees it and
+    keeps it for later jobs. Results come back in the same order as run_all,
+    whichever worker finishes first.
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(partial(_run_job, cache=cache,
+                                     counters=counters, memory=memory),
+                             jobs(solvers, files, inputs)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('selectors', nargs='*', metavar='DAY[.PART]')
+    parser.add_argument('-f', '--file', type=Path, action='append',
+                        default=[], help='input file (repeatable)')
+    parser.add_argument('-i', '--inputs', type=Path, default=ROOT,
+                        help='directory holding NN/*.txt inputs')
+    parser.add_argument('-j', '--jobs', type=int, nargs='?', const=0,
+                        help='run in a process pool (default: one per CPU)')
+    parser.add_argument('--cache', type=Path, nargs='?', const=DEFAULT_DIR,
+                        metavar='DIR', help='reuse answers cached in DIR')
+    parser.add_argument('--counters', action='store_true',
+                        help="report each solver's hot-path counters")
+    parser.add_argument('--memory', type=int, nargs='?', const=TOP,
+                        metavar='TOP', help='trace memory and report peak '
+                        f'and the top allocation sites (default: {TOP})')
+    parser.add_argument('--mmap', action='store_true',
+                        help='memory-map inputs for the days that take bytes')
+    parser.add_argument('--engine', metavar='NAME',
+                        help='run main_NAME instead of main (e.g. numpy, '
+                        'stream) for the days that have it')
+    args = parser.parse_args(argv)
+    if args.mmap and args.jobs is not None:
+        parser.error("--mmap can't be used with -j: mappings stay in this "
+                     'process')
+
+    solvers = select(args.selectors)
+    if args.engine:
+        solvers = [with_engine(x, args.engine) for x in solvers]
+    cache = None if args.cache is None else Cache(args.cache)
+    start = time.perf_counter()
+    count = 0
+    if args.jobs is None:
+        results: Iterable[Result] = run_all(solvers, args.file, args.inputs,
+                                            cache, args.counters,
+                                            args.memory, args.mmap)
+    else:
+        results = run_parallel(solvers, args.file, args.inputs, args.jobs,
+                               cache, args.counters, args.memory)
+    for result in results:
+        print(format_result(result), flush=True)
+        count += 1
+    print(f'{count} runs in {time.perf_counter() - start:.3f} s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Chunked and memory-mapped reading of large inputs.
+
+stdin.read() holds the whole input in memory, and splitlines() on top of it
+holds it again as a list of lines. For days where every line is a record of
+its own, chunks reads a binary stream a fixed-size block at a time and yields
+blocks that end on a line boundary, so a solution can fold over the blocks
+and its memory stays the same however long the input is. The days that
+support this take a --stream flag:
+
+    zcat input.txt.gz | python 01/part1.py --stream
+
+Days whose input is one big block (a grid, or a single huge line) can't be
+folded over in pieces, but they can skip the copies: mapped memory-maps an
+input file, and parsers that take bytes work on the mapping, or on NumPy
+views of it, directly. Nothing is read until it's touched, no str is built,
+and the pages are the kernel's page cache rather than the process's heap.
+Those days take an input path as well as stdin:
+
+    python 09/part1.py input.txt
+
+Inputs that aren't made of lines (day 3's single line of corrupted memory)
+can be searched a block at a time with finditer, which carries the start of
+a match cut off at the end of one block over into the next.
+
+For work that can be split by line, line_ranges cuts a file into byte ranges
+that start and end on line boundaries, so each process in a pool can open
+the file and read just its own range. cut_ranges does the same at any
+boundary, such as a byte that can't be part of one of day 3's instructions.
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+CHUNK_SIZE = 1 << 20
+
+_NEWLINE = re.compile(rb'\n')
+
+
+def chunks(stream: BinaryIO, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields blocks of whole lines from a binary stream, each about size
+    bytes (longer if a single line is). A last line without a newline is
+    yielded as it is.
+
+    >>> import io
+    >>> list(chunks(io.BytesIO(b'1 2\\n3 4\\n5 6\\n7'), 5))
+    [b'1 2\\n', b'3 4\\n', b'5 6\\n', b'7']
+    """
+    carry = b''
+    while block := stream.read(size):
+        if carry:
+            block = carry + block
+        cut = block.rfind(b'\n') + 1
+        carry = block[cut:]
+        if cut:
+            yield block[:cut]
+    if carry:
+        yield carry
+
+
+def finditer(stream: BinaryIO, pattern: re.Pattern[bytes],
+             partial: re.Pattern[bytes],
+             size: int = CHUNK_SIZE) -> Iterator[re.Match[bytes]]:
+    """Yields the matches of pattern in a binary stream, read a block of
+    about size bytes at a time, as pattern.finditer over the whole stream
+    would. partial must match any unfinished start of a match, up to the
+    end of a block (so it ends in \\Z); the earliest such tail after the
+    last match is carried over to the front of the next block. A match
+    must be complete once found (e.g. close with a bracket, not a run of
+    digits). Memory is the block plus the carried tail.
+
+    >>> pattern = re.compile(rb'<(\\d+)>')
+    >>> partial = re.compile(rb'<\\d*\\Z')
+    >>> import io
+    >>> stream = io.BytesIO(b'<1>x<23><<4567>')
+    >>> [m.group(1) for m in finditer(stream, pattern, partial, 3)]
+    [b'1', b'23', b'4567']
+    """
+    carry = b''
+    while block := stream.read(size):
+        if carry:
+            block = carry + block
+        end = 0
+        for match in pattern.finditer(block):
+            yield match
+            end = match.end()
+        tail = partial.search(block, end)
+        carry = block[tail.start():] if tail else b''
+
+
+def cut_ranges(path: str | os.PathLike, parts: int,
+               boundary: re.Pattern[bytes]) -> list[tuple[int, int]]:
+    """Splits a file into about parts (start, end) byte ranges of similar
+    size, each ending just after a match of boundary (or at the end of the
+    file). If no record can span a boundary, each is wholly in one range.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as file:
+    ...     _ = file.write(b'mul(1,2)xmul(3,4)do()!mul(5,6)')
+    ...     file.flush()
+    ...     cut_ranges(file.name, 4, re.compile(rb'[x!]'))
+    [(0, 9), (9, 22), (22, 30)]
+    """
+    with mapped(path) as data:
+        size = len(data)
+        bounds = [0]
+        for i in range(1, parts):
+            # Start from the byte before, so a cut that already falls just
+            # after a boundary stays there
+            match = boundary.search(data, max(size * i // parts - 1,
+                                              bounds[-1]))
+            bounds.append(match.end() if match else size)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:])
+            if end > start]
+
+
+def line_ranges(path: str | os.PathLike,
+                parts: int) -> list[tuple[int, int]]:
+    """Splits a file into about parts (start, end) byte ranges of similar
+    size, each ending just after a newline (or at the end of the file).
+
+    >>> ranges = line_ranges(__file__, 4)
+    >>> with open(__file__, 'rb') as file:
+    ...     data = file.read()
+    >>> ranges[0][0], ranges[-1][1] == len(data), len(ranges)
+    (0, True, 4)
+    >>> all(data[end - 1:end] == b'\\n' for _, end in ranges)
+    True
+    """
+    return cut_ranges(path, parts, _NEWLINE)
+
+
+@contextmanager
+def mapped(path: str | os.PathLike) -> Iterator[mmap.mmap | bytes]:
+    """Memory-maps a file read-only for the length of a with block. Anything
+    viewing the mapping (memoryviews, NumPy arrays) must be gone by the end
+    of the block. An empty file can't be mapped, and gives b''.
+
+    >>> with mapped(__file__) as data:
+    ...     data.find(b'def mapped') > 0
+    True
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view